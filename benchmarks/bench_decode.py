@@ -0,0 +1,168 @@
+"""Benchmark the per-row collector against the columnar batch collector.
+
+Run with ``python -m benchmarks.bench_decode [--fixtures DIR]``. Both
+`collect_from_api` and `collect_batches_from_api` run end to end against a
+replay client, so the numbers include JSON decoding, the expiry filter and
+row construction exactly as in `runner.run`.
+
+``DIR`` holds raw response bodies: ``markets-0000.json``, ``markets-0001.json``
+... (pages chained by ``next_page_token``) and ``orderbooks/<ticker>.json``.
+Record a set with ``python -m benchmarks.bench_decode --capture DIR`` on a
+machine with API access. Without ``--fixtures`` the payloads are synthesized
+in the same shape and the output is labelled as such.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import timeit
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.api.kalshi_client import KalshiClient, KalshiHTTPError
+from src.data.decode import loads
+from src.runner import collect_batches_from_api, collect_from_api
+
+N_MARKETS = 1000
+PAGE_LIMIT = 100
+
+
+class _Recorded:
+    status_code = 200
+    headers: Dict[str, str] = {}
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class ReplayClient(KalshiClient):
+    """`KalshiClient` that serves recorded response bodies instead of HTTP."""
+
+    def __init__(self, pages: List[bytes], books: Dict[str, bytes], **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.pages = pages
+        self.books = books
+        self._page_by_token = {None: 0}
+        for i, page in enumerate(pages):
+            token = json.loads(page).get("next_page_token")
+            if token:
+                self._page_by_token[token] = i + 1
+
+    def _send(self, method: str, path: str, raw: bool = False, **kwargs: Any) -> Any:
+        if path == "/markets":
+            body = self.pages[self._page_by_token[kwargs.get("params", {}).get("page_token")]]
+        else:
+            ticker = path.split("/")[2]
+            if ticker not in self.books:
+                raise KalshiHTTPError(f"No recorded orderbook for {ticker}")
+            body = self.books[ticker]
+        response = _Recorded(body)
+        return response if raw else self._decode(response)
+
+
+def synthetic_payloads(n: int = N_MARKETS) -> Tuple[List[bytes], Dict[str, bytes]]:
+    markets = [
+        {
+            "id": f"EVT{i // 20}-M{i}",
+            "title": f"Will outcome {i} happen?",
+            "close_time": f"2030-01-{1 + (i // 20) % 28:02d}T20:00:00Z",
+            "resolution_source": "kalshi",
+            "status": "open",
+            "yes_bid": 41,
+            "yes_ask": 45,
+        }
+        for i in range(n)
+    ]
+    pages = []
+    for start in range(0, n, PAGE_LIMIT):
+        token = f"p{start + PAGE_LIMIT}" if start + PAGE_LIMIT < n else None
+        pages.append(json.dumps({"markets": markets[start : start + PAGE_LIMIT], "next_page_token": token}).encode())
+    books = {
+        market["id"]: json.dumps(
+            {
+                "orderbook": {"yes": [[0.41, 100], [0.40, 250]], "no": [[0.45, 80], [0.46, 120]]},
+                "last_price": 0.43,
+                "volume": 1000 + i,
+            }
+        ).encode()
+        for i, market in enumerate(markets)
+    }
+    return pages, books
+
+
+def load_fixtures(path: str) -> Tuple[List[bytes], Dict[str, bytes]]:
+    pages = []
+    for name in sorted(os.listdir(path)):
+        if name.startswith("markets-") and name.endswith(".json"):
+            with open(os.path.join(path, name), "rb") as fh:
+                pages.append(fh.read())
+    books = {}
+    book_dir = os.path.join(path, "orderbooks")
+    for name in os.listdir(book_dir):
+        with open(os.path.join(book_dir, name), "rb") as fh:
+            books[name[: -len(".json")]] = fh.read()
+    return pages, books
+
+
+def capture(path: str, limit: int = PAGE_LIMIT, max_books: Optional[int] = None) -> None:
+    """Record live `/markets` pages and their orderbooks into `path`."""
+    client = KalshiClient()
+    os.makedirs(os.path.join(path, "orderbooks"), exist_ok=True)
+    tickers: List[str] = []
+    page_token: Optional[str] = None
+    page = 0
+    while True:
+        params: Dict[str, Any] = {"limit": limit}
+        if page_token:
+            params["page_token"] = page_token
+        response = client._send("GET", "/markets", raw=True, params=params)
+        with open(os.path.join(path, f"markets-{page:04d}.json"), "wb") as fh:
+            fh.write(response.content)
+        payload = response.json()
+        tickers.extend(market["id"] for market in payload.get("markets", []))
+        page_token = payload.get("next_page_token")
+        page += 1
+        if not page_token:
+            break
+
+    for ticker in tickers[:max_books]:
+        try:
+            response = client._send("GET", f"/markets/{ticker}/orderbook", raw=True)
+        except KalshiHTTPError:
+            continue
+        with open(os.path.join(path, "orderbooks", f"{ticker}.json"), "wb") as fh:
+            fh.write(response.content)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", help="Directory of recorded responses")
+    parser.add_argument("--capture", metavar="DIR", help="Record live responses into DIR and exit")
+    args = parser.parse_args(argv)
+
+    if args.capture:
+        capture(args.capture)
+        return
+
+    pages, books = load_fixtures(args.fixtures) if args.fixtures else synthetic_payloads()
+    n_markets = sum(len(json.loads(page).get("markets", [])) for page in pages)
+    print(f"{'recorded' if args.fixtures else 'synthetic'} payloads: {n_markets} markets, {len(books)} orderbooks")
+
+    baseline = ReplayClient(pages, books)
+    fast = ReplayClient(pages, books, json_loads=loads)
+    results = {}
+    for name, fn in (
+        ("baseline", lambda: collect_from_api(baseline, limit=PAGE_LIMIT)),
+        ("fast", lambda: collect_batches_from_api(fast, limit=PAGE_LIMIT)),
+    ):
+        results[name] = min(timeit.repeat(fn, number=5, repeat=5)) / 5
+        print(f"{name:>8}: {results[name] * 1e6 / n_markets:7.2f} us/market")
+    print(f" speedup: {results['baseline'] / results['fast']:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Benchmark sync vs asyncio Kalshi transports against a local stand-in server.
+
+Run with ``python -m benchmarks.bench_transport`` (needs aiohttp). The
+server runs in a subprocess so it does not share the client's GIL; it adds
+a fixed per-request latency, gzips bodies when asked, and counts TCP
+connections so keep-alive reuse is visible next to wall time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import multiprocessing
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from aiohttp import web
+
+from src.api.async_client import AsyncKalshiClient
+from src.api.kalshi_client import KalshiClient
+
+N_REQUESTS = 1000
+CONCURRENCY = 32
+LATENCY_S = 0.005
+
+BOOK = json.dumps(
+    {"orderbook": {"yes": [[0.41, 100]] * 20, "no": [[0.45, 80]] * 20}, "last_price": 0.43, "volume": 1000}
+).encode()
+BOOK_GZ = gzip.compress(BOOK)
+
+
+def serve(port_queue) -> None:
+    peers = set()
+
+    async def orderbook(request: web.Request) -> web.Response:
+        peers.add(request.transport.get_extra_info("peername"))
+        await asyncio.sleep(LATENCY_S)
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            return web.Response(body=BOOK_GZ, content_type="application/json", headers={"Content-Encoding": "gzip"})
+        return web.Response(body=BOOK, content_type="application/json")
+
+    async def connections(_request: web.Request) -> web.Response:
+        count = len(peers)
+        peers.clear()
+        return web.json_response({"connections": count})
+
+    async def run_server() -> None:
+        app = web.Application()
+        app.router.add_get("/markets/{ticker}/orderbook", orderbook)
+        app.router.add_get("/connections", connections)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port_queue.put(runner.addresses[0][1])
+        await asyncio.Event().wait()
+
+    asyncio.run(run_server())
+
+
+def bench_sync_default(base_url: str) -> None:
+    client = KalshiClient(base_url=base_url)
+    client.session = requests.Session()  # stock session: 10-connection pool, implicit headers
+    with ThreadPoolExecutor(CONCURRENCY) as pool:
+        list(pool.map(client.get_market_orderbook, (f"M{i}" for i in range(N_REQUESTS))))
+
+
+def bench_sync_pooled(base_url: str) -> None:
+    client = KalshiClient(base_url=base_url, pool_maxsize=CONCURRENCY)
+    with ThreadPoolExecutor(CONCURRENCY) as pool:
+        list(pool.map(client.get_market_orderbook, (f"M{i}" for i in range(N_REQUESTS))))
+
+
+def bench_async(base_url: str) -> None:
+    async def go() -> None:
+        async with AsyncKalshiClient(base_url=base_url, max_connections=CONCURRENCY) as client:
+            await client.gather_orderbooks([f"M{i}" for i in range(N_REQUESTS)])
+
+    asyncio.run(go())
+
+
+def main() -> None:
+    port_queue = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(port_queue,), daemon=True)
+    server.start()
+    base_url = f"http://127.0.0.1:{port_queue.get(timeout=10)}"
+    try:
+        for name, fn in (("sync-default", bench_sync_default), ("sync-pooled", bench_sync_pooled), ("async", bench_async)):
+            requests.get(f"{base_url}/connections")  # reset the peer counter
+            start = time.perf_counter()
+            fn(base_url)
+            elapsed = time.perf_counter() - start
+            opened = requests.get(f"{base_url}/connections").json()["connections"]
+            print(
+                f"{name:>12}: {elapsed * 1e3:7.1f} ms for {N_REQUESTS} requests "
+                f"({N_REQUESTS / elapsed:6.0f} req/s, {opened} connections opened)"
+            )
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
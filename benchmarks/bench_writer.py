@@ -0,0 +1,48 @@
+"""Benchmark synchronous commits vs the group-commit background writer.
+
+Run with ``python -m benchmarks.bench_writer``. Reports the latency callers
+see per `insert_snapshot` and end-to-end throughput up to a durable flush.
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from src.data.sqlite_store import SQLiteStore
+from src.models.schemas import Snapshot
+
+N_ROWS = 5000
+
+
+def run(async_writes: bool) -> None:
+    snapshot = Snapshot(market_id="M1", ts=datetime.now(tz=timezone.utc), bid=0.41, ask=0.45, last=0.43, volume=10)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteStore(os.path.join(tmp, "bench.db"), async_writes=async_writes)
+        latencies = []
+        start = time.perf_counter()
+        for _ in range(N_ROWS):
+            t0 = time.perf_counter()
+            store.insert_snapshot(snapshot)
+            latencies.append(time.perf_counter() - t0)
+        store.flush()
+        elapsed = time.perf_counter() - start
+        store.close()
+
+    name = "group-commit" if async_writes else "sync"
+    print(
+        f"{name:>12}: p50 {statistics.median(latencies) * 1e6:8.1f} us/insert, "
+        f"{N_ROWS / elapsed:8.0f} rows/s durable"
+    )
+
+
+def main() -> None:
+    run(async_writes=False)
+    run(async_writes=True)
+
+
+if __name__ == "__main__":
+    main()
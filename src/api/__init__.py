@@ -1,5 +1,22 @@
 """Public API surface for Kakashi data clients."""
 
-from .kalshi_client import KalshiClient, KalshiHTTPError
+from typing import TYPE_CHECKING
 
-__all__ = ["KalshiClient", "KalshiHTTPError"]
+from src._lazy import lazy_exports
+
+__all__ = ["AsyncKalshiClient", "KalshiClient", "KalshiHTTPError", "ResponseCache"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AsyncKalshiClient": "async_client",
+        "KalshiClient": "kalshi_client",
+        "KalshiHTTPError": "kalshi_client",
+        "ResponseCache": "cache",
+    },
+)
+
+if TYPE_CHECKING:
+    from .async_client import AsyncKalshiClient
+    from .cache import ResponseCache
+    from .kalshi_client import KalshiClient, KalshiHTTPError
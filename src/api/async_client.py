@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:  # Optional dependency for the asyncio transport
+    import aiohttp
+except ImportError:  # pragma: no cover - exercised when aiohttp is absent
+    aiohttp = None
+
+from .cache import ResponseCache
+from .kalshi_client import KalshiClientBase, KalshiHTTPError, MarketPage
+from .transport import DEFAULT_HEADERS
+
+
+class AsyncKalshiClient(KalshiClientBase):
+    """asyncio counterpart of `KalshiClient` built on a pooled aiohttp session.
+
+    Mirrors the sync `_request`/`get_market_orderbook` interface, including
+    `cache=` and `use_cache`, as coroutines.
+    One connector is shared by every request, so concurrent calls reuse
+    keep-alive connections instead of paying a handshake or a thread each.
+    Use as ``async with AsyncKalshiClient() as client: ...``.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: float = 10.0,
+        retries: int = 3,
+        max_connections: int = 32,
+        json_loads: Optional[Callable[[bytes], Any]] = None,
+        cache: Optional[ResponseCache] = None,
+    ):
+        if aiohttp is None:
+            raise ImportError("AsyncKalshiClient requires aiohttp (pip install aiohttp)")
+        if max_connections <= 0:
+            raise ValueError("max_connections must be positive")
+        super().__init__(base_url=base_url, timeout=timeout, retries=retries, cache=cache, json_loads=json_loads)
+        self.max_connections = max_connections
+        self.session: Optional["aiohttp.ClientSession"] = None
+
+    async def __aenter__(self) -> "AsyncKalshiClient":
+        self._ensure_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def _ensure_session(self) -> "aiohttp.ClientSession":
+        # The session binds to the running loop, so it is created lazily
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, limit_per_host=self.max_connections)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers=DEFAULT_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self.session
+
+    async def close(self) -> None:
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def _request(self, method: str, path: str, use_cache: bool = True, **kwargs: Any) -> Dict[str, Any]:
+        return (await self._fetch(method, path, use_cache=use_cache, **kwargs))[0]
+
+    async def _fetch(
+        self, method: str, path: str, use_cache: bool = True, **kwargs: Any
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Like `_request`, also reporting whether the cached payload was reused."""
+        probe = self._cache_probe(method, path, use_cache, kwargs)
+        if probe is None:
+            _, _, body = await self._send(method, path, **kwargs)
+            return self._decode(body), False
+        if probe.fresh:
+            return self._cache_hit(probe), True
+
+        status, headers, body = await self._send(method, path, **kwargs)
+        return self._cache_response(probe, status, headers, body, lambda: self._decode(body))
+
+    async def _send(self, method: str, path: str, **kwargs: Any) -> Tuple[int, Any, bytes]:
+        session = self._ensure_session()
+        url = self._url(path)
+        backoff = 1.0
+
+        for attempt in range(1, self.retries + 1):
+            try:
+                async with session.request(method, url, **kwargs) as response:
+                    status = response.status
+                    headers = response.headers
+                    body = await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:  # pragma: no cover - network instability
+                self._transport_failed(exc, attempt)
+                await asyncio.sleep(backoff)
+                backoff *= 2
+                continue
+
+            if self._should_retry(status, attempt, lambda: repr(body[:200])):
+                await asyncio.sleep(backoff)
+                backoff *= 2
+                continue
+
+            return status, headers, body
+
+        raise KalshiHTTPError("Kalshi request unexpectedly exhausted retries")
+
+    def _decode(self, body: bytes) -> Dict[str, Any]:
+        return self._parse_json(lambda: (self.json_loads or json.loads)(body))
+
+    async def iter_market_pages(self, limit: int = 100) -> AsyncIterator[MarketPage]:
+        """Yield `/markets` pages in order, flagging ones the cache reports unchanged."""
+        page_token: Optional[str] = None
+
+        while True:
+            payload, unchanged = await self._fetch("GET", "/markets", params=self._page_params(limit, page_token))
+            yield MarketPage(payload.get("markets", []), unchanged)
+            page_token = payload.get("next_page_token")
+
+            if not page_token:
+                break
+
+    async def get_markets_paginated(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """Fetch all markets with naive pagination support."""
+        return [market async for page in self.iter_market_pages(limit=limit) for market in page.markets]
+
+    async def get_market_orderbook(self, ticker: str) -> Dict[str, Any]:
+        """Fetch the orderbook for a specific market ticker (never cached)."""
+        return await self._request("GET", f"/markets/{ticker}/orderbook", use_cache=False)
+
+    async def gather_orderbooks(self, tickers: Sequence[str]) -> List[Tuple[str, Dict[str, Any]]]:
+        """Fetch many orderbooks concurrently; tickers that fail are skipped.
+
+        Concurrency is bounded by the connector's `max_connections`.
+        """
+        results = await asyncio.gather(
+            *(self.get_market_orderbook(ticker) for ticker in tickers), return_exceptions=True
+        )
+        books: List[Tuple[str, Dict[str, Any]]] = []
+        for ticker, result in zip(tickers, results):
+            if isinstance(result, KalshiHTTPError):
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            books.append((ticker, result))
+        return books
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from fnmatch import fnmatchcase
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+
+@dataclass
+class CacheEntry:
+    payload: Dict[str, Any]
+    expires_at: float
+    size: int = 0
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional-request headers for revalidating this entry."""
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def wire_size(headers: Optional[Mapping[str, str]], body: bytes) -> int:
+    """Bytes a response took on the wire: `Content-Length` when sent, else the body.
+
+    The body is already decompressed, so it overstates gzip-encoded responses.
+    """
+    length = (headers or {}).get("Content-Length")
+    if length is not None:
+        try:
+            return int(length)
+        except ValueError:
+            pass
+    return len(body)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    bytes_saved: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups served without downloading a body (fresh or 304)."""
+        total = self.hits + self.revalidated + self.misses
+        return (self.hits + self.revalidated) / total if total else 0.0
+
+
+class ResponseCache:
+    """TTL cache for slow-changing GET responses with HTTP revalidation.
+
+    `ttls` maps endpoint path patterns (``fnmatch`` syntax, e.g. ``"/markets"``
+    or ``"/events/*"``) to lifetimes in seconds; paths without a match are not
+    cached. Expired entries carrying an ETag or Last-Modified are revalidated
+    with a conditional request rather than dropped. When `persist_path` is
+    set, entries are loaded on start-up and written back by `save()`.
+    Safe to share between threads using one client.
+    """
+
+    DEFAULT_TTLS: Mapping[str, float] = {"/markets": 300.0}
+
+    def __init__(
+        self,
+        ttls: Optional[Mapping[str, float]] = None,
+        persist_path: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ttls = dict(self.DEFAULT_TTLS if ttls is None else ttls)
+        self.persist_path = persist_path
+        self.clock = clock
+        self.stats = CacheStats()
+        self._entries: Dict[str, CacheEntry] = {}
+        self._lock = threading.Lock()
+        if persist_path and os.path.exists(persist_path):
+            self._load()
+
+    @staticmethod
+    def key(path: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        if not params:
+            return path
+        query = "&".join(f"{k}={params[k]}" for k in sorted(params))
+        return f"{path}?{query}"
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        for pattern, ttl in self.ttls.items():
+            if fnmatchcase(path, pattern):
+                return ttl
+        return None
+
+    def lookup(self, key: str) -> Tuple[Optional[CacheEntry], bool]:
+        """Return ``(entry, fresh)``; a stale entry may still be revalidated."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, False
+            fresh = entry.is_fresh(self.clock())
+            if not fresh and not (entry.etag or entry.last_modified):
+                del self._entries[key]
+                return None, False
+            return entry, fresh
+
+    def record_hit(self, entry: CacheEntry) -> Dict[str, Any]:
+        with self._lock:
+            self.stats.hits += 1
+            self.stats.bytes_saved += entry.size
+        return entry.payload
+
+    def record_not_modified(self, entry: CacheEntry, ttl: float) -> Dict[str, Any]:
+        with self._lock:
+            self.stats.revalidated += 1
+            self.stats.bytes_saved += entry.size
+            entry.expires_at = self.clock() + ttl
+        return entry.payload
+
+    def store(
+        self,
+        key: str,
+        payload: Dict[str, Any],
+        ttl: float,
+        headers: Optional[Mapping[str, str]] = None,
+        size: int = 0,
+    ) -> None:
+        headers = headers or {}
+        entry = CacheEntry(
+            payload=payload,
+            expires_at=self.clock() + ttl,
+            size=size,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+        with self._lock:
+            self.stats.misses += 1
+            self._entries[key] = entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def save(self) -> None:
+        """Write entries to `persist_path` (no-op when persistence is off)."""
+        if not self.persist_path:
+            return
+        directory = os.path.dirname(self.persist_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            snapshot = {key: asdict(entry) for key, entry in self._entries.items()}
+        tmp_path = f"{self.persist_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(snapshot, fh)
+        os.replace(tmp_path, self.persist_path)
+
+    def _load(self) -> None:
+        try:
+            with open(self.persist_path, encoding="utf-8") as fh:
+                raw = json.load(fh)
+            self._entries = {key: CacheEntry(**value) for key, value in raw.items()}
+        except (OSError, ValueError, TypeError):
+            # A corrupt cache file only costs a cold start.
+            self._entries = {}
@@ -2,6 +2,8 @@ import time
 from typing import Dict, Iterable, Optional
 import requests
 
+from .transport import build_session
+
 API_BASE = "https://api.elections.kalshi.com/trade-api/v2"
 
 class KalshiHTTPError(RuntimeError):
@@ -14,15 +16,21 @@ class KalshiClient:
     Docs: https://docs.kalshi.com (public market data quick start)
     """
 
-    def __init__(self, base_url: str = API_BASE, timeout: float = 10.0, max_retries: int = 3):
+    def __init__(
+        self,
+        base_url: str = API_BASE,
+        timeout: float = 10.0,
+        max_retries: int = 3,
+        pool_connections: int = 10,
+        pool_maxsize: int = 32,
+    ):
         self.base_url = base_url.rstrip("/")
-        self.session = requests.Session()
+        self.session = build_session(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
         self.timeout = timeout
         self.max_retries = max_retries
 
         # Be a good citizen
         self.session.headers.update({
-            "Accept": "application/json",
             "User-Agent": "KakashiBot/0.1 (+https://github.com/0KSTONE/Kakashi)"
         })
 
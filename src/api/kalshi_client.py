@@ -2,80 +2,205 @@ from __future__ import annotations
 
 import os
 import time
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
 
 import requests
 
+from .cache import CacheEntry, ResponseCache, wire_size
+from .transport import build_session
+
 
 class KalshiHTTPError(Exception):
     """Raised when a Kalshi HTTP request cannot be satisfied."""
 
 
-class KalshiClient:
-    """Minimal read-only Kalshi client with simple retry/backoff."""
+@dataclass
+class MarketPage:
+    """One `/markets` page; `unchanged` when served fresh from cache or by a 304."""
+
+    markets: List[Dict[str, Any]]
+    unchanged: bool = False
+
+
+@dataclass
+class CacheProbe:
+    """Cache state for one request that goes through a `ResponseCache`."""
+
+    key: str
+    ttl: float
+    entry: Optional[CacheEntry]
+    fresh: bool
+
+
+class KalshiClientBase:
+    """Transport-independent request logic shared by the sync and async clients.
+
+    Subclasses do the I/O and the sleeping; status classification, error
+    messages, JSON decoding, pagination parameters and the cache protocol
+    (lookup, revalidation headers, 304 handling, store) live here.
+    """
 
     RETRY_STATUS = {429, 500, 502, 503, 504}
 
-    def __init__(self, base_url: Optional[str] = None, timeout: float = 10.0, retries: int = 3):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: float = 10.0,
+        retries: int = 3,
+        cache: Optional[ResponseCache] = None,
+        json_loads: Optional[Callable[[bytes], Any]] = None,
+    ):
         self.base_url = base_url or os.getenv("KALSHI_BASE_URL", "https://api.elephant.kalshi.com/v1")
         self.timeout = timeout
         self.retries = retries
-        self.session = requests.Session()
+        self.cache = cache
+        self.json_loads = json_loads
+
+    def _url(self, path: str) -> str:
+        return f"{self.base_url.rstrip('/')}{path}"
+
+    def _transport_failed(self, exc: Exception, attempt: int) -> None:
+        """Raise once a connection-level failure has used up the retries."""
+        if attempt == self.retries:
+            raise KalshiHTTPError(f"Request failed after {self.retries} attempts: {exc}") from exc
+
+    def _should_retry(self, status: int, attempt: int, text: Callable[[], str]) -> bool:
+        """True to back off and retry; raises for terminal error statuses."""
+        if status in self.RETRY_STATUS:
+            if attempt == self.retries:
+                raise KalshiHTTPError(f"Kalshi request failed after retries ({status}): {text()}")
+            return True
+        if 400 <= status:
+            raise KalshiHTTPError(f"Kalshi request failed with status {status}: {text()}")
+        return False
+
+    @staticmethod
+    def _parse_json(decode: Callable[[], Any]) -> Dict[str, Any]:
+        try:
+            return decode()
+        except ValueError as exc:  # pragma: no cover - unexpected payloads
+            raise KalshiHTTPError("Kalshi response was not valid JSON") from exc
+
+    def _cache_probe(self, method: str, path: str, use_cache: bool, kwargs: Dict[str, Any]) -> Optional[CacheProbe]:
+        """Look the request up in the cache; None when it bypasses the cache.
+
+        A stale entry that can be revalidated adds its conditional headers
+        to `kwargs`.
+        """
+        ttl = self.cache.ttl_for(path) if self.cache is not None and use_cache and method == "GET" else None
+        if ttl is None:
+            return None
+        key = self.cache.key(path, kwargs.get("params"))
+        entry, fresh = self.cache.lookup(key)
+        if entry is not None and not fresh:
+            kwargs["headers"] = {**kwargs.get("headers", {}), **entry.validators()}
+        return CacheProbe(key=key, ttl=ttl, entry=entry, fresh=fresh)
+
+    def _cache_hit(self, probe: CacheProbe) -> Dict[str, Any]:
+        return self.cache.record_hit(probe.entry)
+
+    def _cache_response(
+        self,
+        probe: CacheProbe,
+        status: int,
+        headers: Mapping[str, str],
+        content: bytes,
+        decode: Callable[[], Dict[str, Any]],
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Resolve a cache-eligible response to ``(payload, reused_cached_payload)``."""
+        if probe.entry is not None and status == 304:
+            return self.cache.record_not_modified(probe.entry, probe.ttl), True
+        payload = decode()
+        self.cache.store(probe.key, payload, probe.ttl, headers=headers, size=wire_size(headers, content))
+        return payload, False
+
+    @staticmethod
+    def _page_params(limit: int, page_token: Optional[str]) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"limit": limit}
+        if page_token:
+            params["page_token"] = page_token
+        return params
+
+
+class KalshiClient(KalshiClientBase):
+    """Minimal read-only Kalshi client with simple retry/backoff."""
 
-    def _request(self, method: str, path: str, **kwargs: Any) -> Dict[str, Any]:
-        url = f"{self.base_url.rstrip('/')}{path}"
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: float = 10.0,
+        retries: int = 3,
+        cache: Optional[ResponseCache] = None,
+        json_loads: Optional[Callable[[bytes], Any]] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 32,
+    ):
+        super().__init__(base_url=base_url, timeout=timeout, retries=retries, cache=cache, json_loads=json_loads)
+        # One pooled session shared by all threads using this client
+        self.session = build_session(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+
+    def _request(self, method: str, path: str, use_cache: bool = True, **kwargs: Any) -> Dict[str, Any]:
+        return self._fetch(method, path, use_cache=use_cache, **kwargs)[0]
+
+    def _fetch(
+        self, method: str, path: str, use_cache: bool = True, **kwargs: Any
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Like `_request`, also reporting whether the cached payload was reused."""
+        probe = self._cache_probe(method, path, use_cache, kwargs)
+        if probe is None:
+            return self._send(method, path, **kwargs), False
+        if probe.fresh:
+            return self._cache_hit(probe), True
+
+        response = self._send(method, path, raw=True, **kwargs)
+        return self._cache_response(
+            probe, response.status_code, response.headers, response.content, lambda: self._decode(response)
+        )
+
+    def _send(self, method: str, path: str, raw: bool = False, **kwargs: Any) -> Any:
+        url = self._url(path)
         backoff = 1.0
 
         for attempt in range(1, self.retries + 1):
             try:
                 response = self.session.request(method, url, timeout=self.timeout, **kwargs)
             except requests.RequestException as exc:  # pragma: no cover - network instability
-                if attempt == self.retries:
-                    raise KalshiHTTPError(f"Request failed after {self.retries} attempts: {exc}") from exc
+                self._transport_failed(exc, attempt)
                 time.sleep(backoff)
                 backoff *= 2
                 continue
 
-            if response.status_code in self.RETRY_STATUS:
-                if attempt == self.retries:
-                    raise KalshiHTTPError(
-                        f"Kalshi request failed after retries ({response.status_code}): {response.text}"
-                    )
+            if self._should_retry(response.status_code, attempt, lambda: response.text):
                 time.sleep(backoff)
                 backoff *= 2
                 continue
 
-            if 400 <= response.status_code:
-                raise KalshiHTTPError(
-                    f"Kalshi request failed with status {response.status_code}: {response.text}"
-                )
-
-            try:
-                return response.json()
-            except ValueError as exc:  # pragma: no cover - unexpected payloads
-                raise KalshiHTTPError("Kalshi response was not valid JSON") from exc
+            return response if raw else self._decode(response)
 
         raise KalshiHTTPError("Kalshi request unexpectedly exhausted retries")
 
-    def get_markets_paginated(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """Fetch all markets with naive pagination support."""
-        markets: List[Dict[str, Any]] = []
+    def _decode(self, response: Any) -> Dict[str, Any]:
+        if self.json_loads is not None:
+            return self._parse_json(lambda: self.json_loads(response.content))
+        return self._parse_json(response.json)
+
+    def iter_market_pages(self, limit: int = 100) -> Iterator[MarketPage]:
+        """Yield `/markets` pages in order, flagging ones the cache reports unchanged."""
         page_token: Optional[str] = None
 
         while True:
-            params: Dict[str, Any] = {"limit": limit}
-            if page_token:
-                params["page_token"] = page_token
-
-            payload = self._request("GET", "/markets", params=params)
-            markets.extend(payload.get("markets", []))
+            payload, unchanged = self._fetch("GET", "/markets", params=self._page_params(limit, page_token))
+            yield MarketPage(payload.get("markets", []), unchanged)
             page_token = payload.get("next_page_token")
 
             if not page_token:
                 break
 
-        return markets
+    def get_markets_paginated(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """Fetch all markets with naive pagination support."""
+        return [market for page in self.iter_market_pages(limit=limit) for market in page.markets]
 
     def get_market_orderbook(self, ticker: str) -> Dict[str, Any]:
-        """Fetch the orderbook for a specific market ticker."""
-        return self._request("GET", f"/markets/{ticker}/orderbook")
+        """Fetch the orderbook for a specific market ticker (never cached)."""
+        return self._request("GET", f"/markets/{ticker}/orderbook", use_cache=False)
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+
+def build_session(pool_connections: int = 10, pool_maxsize: int = 32, pool_block: bool = True) -> requests.Session:
+    """Session with a sized keep-alive pool and explicit compression negotiation.
+
+    `pool_maxsize` bounds open connections per host; with `pool_block` extra
+    threads wait for a free connection instead of opening and discarding
+    throwaway ones, so TCP/TLS handshakes stay amortized under concurrency.
+    """
+    if pool_connections <= 0 or pool_maxsize <= 0:
+        raise ValueError("pool sizes must be positive")
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    return session
@@ -1,5 +1,13 @@
 """Persistence layer helpers for Kakashi."""
 
-from .sqlite_store import SQLiteStore
+from typing import TYPE_CHECKING
 
-__all__ = ["SQLiteStore"]
+from src._lazy import lazy_exports
+
+__all__ = ["MarketIndex", "SQLiteStore"]
+
+__getattr__, __dir__ = lazy_exports(__name__, {"MarketIndex": "market_index", "SQLiteStore": "sqlite_store"})
+
+if TYPE_CHECKING:
+    from .market_index import MarketIndex
+    from .sqlite_store import SQLiteStore
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+try:  # Optional accelerated JSON parser
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON with orjson when installed, falling back to the stdlib."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@dataclass
+class MarketBatch:
+    """Column-oriented market rows ready for `SQLiteStore.upsert_market_batch`.
+
+    `close_time` holds the ISO text stored in SQLite; `close_ts` the same
+    instant as a UTC epoch (naive values are treated as UTC).
+    """
+
+    id: List[str] = field(default_factory=list)
+    question: List[str] = field(default_factory=list)
+    close_time: List[str] = field(default_factory=list)
+    close_ts: List[float] = field(default_factory=list)
+    resolution_source: List[str] = field(default_factory=list)
+
+    def rows(self) -> Iterator[Tuple[str, str, str, str]]:
+        return zip(self.id, self.question, self.close_time, self.resolution_source)
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+
+@dataclass
+class SnapshotBatch:
+    """Column-oriented snapshot rows; `ts` is UTC epoch milliseconds."""
+
+    market_id: List[str] = field(default_factory=list)
+    ts: List[int] = field(default_factory=list)
+    bid: List[float] = field(default_factory=list)
+    ask: List[float] = field(default_factory=list)
+    last: List[float] = field(default_factory=list)
+    volume: List[int] = field(default_factory=list)
+    rejected: List[str] = field(default_factory=list)
+
+    def rows(self) -> Iterator[Tuple[str, int, float, float, float, int]]:
+        return zip(self.market_id, self.ts, self.bid, self.ask, self.last, self.volume)
+
+    def __len__(self) -> int:
+        return len(self.market_id)
+
+
+def parse_timestamps(values: List[Any]) -> List[datetime]:
+    """Parse ISO timestamps, decoding each distinct string only once.
+
+    Close times cluster heavily (every market in an event shares one), so a
+    page typically has far fewer distinct values than rows.
+    """
+    parsed: Dict[str, datetime] = {}
+    now = datetime.now(tz=timezone.utc)
+    out: List[datetime] = []
+    for value in values:
+        if isinstance(value, str):
+            dt = parsed.get(value)
+            if dt is None:
+                dt = parsed[value] = datetime.fromisoformat(value)
+        elif isinstance(value, datetime):
+            dt = value
+        else:  # pragma: no cover - defensive fallback for unexpected payload
+            dt = now
+        out.append(dt)
+    return out
+
+
+def _epoch(dt: datetime) -> float:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def decode_markets(raw_markets: Iterable[Dict[str, Any]]) -> MarketBatch:
+    """Turn raw `/markets` entries into a `MarketBatch` (same fields as `_parse_market`)."""
+    batch = MarketBatch()
+    ids, questions = batch.id.append, batch.question.append
+    close_times, close_tss = batch.close_time.append, batch.close_ts.append
+    sources = batch.resolution_source.append
+    # Keyed by the raw value, so each distinct close time is parsed,
+    # re-serialized and converted to an epoch once per page
+    converted: Dict[Any, Tuple[str, float]] = {}
+    for raw in raw_markets:
+        ids(raw["id"])
+        questions(raw.get("question", raw.get("title", "")))
+        close = raw.get("close_time") or raw.get("close_time_str")
+        cached = converted.get(close)
+        if cached is None:
+            dt = parse_timestamps([close])[0]
+            cached = converted[close] = (dt.isoformat(), _epoch(dt))
+        close_times(cached[0])
+        close_tss(cached[1])
+        sources(raw.get("resolution_source", "unknown"))
+    return batch
+
+
+def decode_poll_keys(raw_markets: Iterable[Dict[str, Any]]) -> Tuple[List[str], List[float]]:
+    """Market ids and close epochs only, for pages whose rows are already stored."""
+    ids: List[str] = []
+    close_ts: List[float] = []
+    converted: Dict[Any, float] = {}
+    for raw in raw_markets:
+        close = raw.get("close_time") or raw.get("close_time_str")
+        ts = converted.get(close)
+        if ts is None:
+            ts = converted[close] = _epoch(parse_timestamps([close])[0])
+        ids.append(raw["id"])
+        close_ts.append(ts)
+    return ids, close_ts
+
+
+def orderbook_quotes(payload: Dict[str, Any]) -> Tuple[float, float, float, int]:
+    """Best bid, ask, last and volume from an orderbook payload."""
+    book = payload.get("orderbook") or {}
+    bids = book.get("yes") or []
+    asks = book.get("no") or []
+    best_bid = bids[0][0] if bids else 0.0
+    best_ask = asks[0][0] if asks else max(best_bid, 0.01)
+    last = payload.get("last_price", best_bid or best_ask)
+    return best_bid, max(best_ask, best_bid), last, int(payload.get("volume", 0))
+
+
+_PRICE_TYPES = (int, float)
+
+
+def decode_orderbooks(books: Iterable[Tuple[str, Dict[str, Any]]], ts: datetime) -> SnapshotBatch:
+    """Turn ``(ticker, orderbook payload)`` pairs into a `SnapshotBatch`.
+
+    Rows that would fail `Snapshot` validation are dropped and their tickers
+    recorded in `rejected` instead of raising mid-page.
+    """
+    batch = SnapshotBatch()
+    epoch_ms = int(_epoch(ts) * 1000)
+    market_ids, stamps, bids = batch.market_id.append, batch.ts.append, batch.bid.append
+    asks, lasts, volumes = batch.ask.append, batch.last.append, batch.volume.append
+    for ticker, payload in books:
+        try:
+            bid, ask, last, volume = orderbook_quotes(payload)
+        except (TypeError, ValueError, IndexError, KeyError, AttributeError):
+            # Malformed levels, non-numeric prices or an unparseable volume
+            batch.rejected.append(ticker)
+            continue
+        # Exact type checks also keep bools out; this runs once per market
+        if not (
+            type(bid) in _PRICE_TYPES
+            and type(ask) in _PRICE_TYPES
+            and type(last) in _PRICE_TYPES
+            and 0 <= bid <= 1
+            and 0 <= ask <= 1
+            and 0 <= last <= 1
+            and volume >= 0
+        ):
+            batch.rejected.append(ticker)
+            continue
+        market_ids(ticker)
+        stamps(epoch_ms)
+        bids(bid)
+        asks(ask)
+        lasts(last)
+        volumes(volume)
+    return batch
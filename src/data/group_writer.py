@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence
+
+
+@dataclass
+class WriteOp:
+    sql: str
+    params: Any
+    many: bool
+    future: Future
+    rows: int = 1
+
+
+@dataclass
+class FlushMarker:
+    future: Future
+    report_errors: bool = True
+
+
+_STOP = object()
+
+
+class GroupCommitWriter:
+    """Background thread that applies queued writes and commits them in groups.
+
+    A group is committed once it holds `batch_rows` rows, once the oldest
+    queued write is `batch_interval` seconds old, or when `flush()` asks for
+    it. At most `max_queue_rows` rows may be queued or awaiting commit, with
+    an `executemany` batch counting each of its rows; `submit` blocks until
+    enough rows commit, so a slow disk pushes back on producers instead of
+    growing memory without bound. A single batch larger than the limit is
+    still accepted once the queue has drained.
+
+    Write errors are reported through each write's future; `flush()` also
+    re-raises the first one since the previous flush, `drain()` never does.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        batch_rows: int = 500,
+        batch_interval: float = 0.05,
+        max_queue_rows: int = 10_000,
+    ) -> None:
+        if batch_rows <= 0 or batch_interval <= 0 or max_queue_rows <= 0:
+            raise ValueError("batch_rows, batch_interval and max_queue_rows must be positive")
+        self.db_path = db_path
+        self.batch_rows = batch_rows
+        self.batch_interval = batch_interval
+        self.max_queue_rows = max_queue_rows
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._queued_rows = 0
+        # Only touched by the writer thread; handed to flushers via markers
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._stopped = False
+        # Guards row accounting and serializes enqueueing against close()
+        # so nothing lands behind _STOP
+        self._cond = threading.Condition()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="sqlite-group-writer", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    def submit(self, sql: str, params: Any, many: bool = False) -> Future:
+        """Queue a write; the future resolves once its group has committed."""
+        if many:
+            params = list(params)
+        op = WriteOp(sql=sql, params=params, many=many, future=Future(), rows=len(params) if many else 1)
+        self._enqueue(op)
+        return op.future
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Block until every write submitted so far is committed.
+
+        Re-raises the first write error seen since the previous flush.
+        """
+        error = self._wait(FlushMarker(Future()), timeout)
+        if error is not None:
+            raise error
+
+    def drain(self, timeout: Optional[float] = None) -> None:
+        """Like `flush`, but leaves write errors to the futures and `flush()`."""
+        self._wait(FlushMarker(Future(), report_errors=False), timeout)
+
+    def _wait(self, marker: FlushMarker, timeout: Optional[float]) -> Optional[BaseException]:
+        self._enqueue(marker)
+        return marker.future.result(timeout=timeout)
+
+    def close(self) -> None:
+        """Commit outstanding writes and stop the writer thread."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            if not self._stopped:
+                self._queue.put(_STOP)
+            self._cond.notify_all()
+        self._thread.join()
+        self._fail_queued()
+
+    def _enqueue(self, item: Any) -> None:
+        rows = item.rows if isinstance(item, WriteOp) else 0
+        with self._cond:
+            while True:
+                if self._closed or self._stopped:
+                    raise RuntimeError("writer is closed")
+                # Flush markers carry no rows and must never wait behind the bound
+                if rows == 0 or self._queued_rows == 0 or self._queued_rows + rows <= self.max_queue_rows:
+                    break
+                self._cond.wait()
+            self._queued_rows += rows
+            self._queue.put(item)
+
+    def _release(self, rows: int) -> None:
+        with self._cond:
+            self._queued_rows -= rows
+            self._cond.notify_all()
+
+    def _fail_queued(self) -> None:
+        """Resolve anything left on the queue once the thread has stopped."""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if isinstance(item, (WriteOp, FlushMarker)) and not item.future.done():
+                item.future.set_exception(RuntimeError("writer is closed"))
+
+    def _run(self) -> None:
+        conn = sqlite3.connect(self.db_path)
+        self._ready.set()
+        try:
+            self._loop(conn)
+        finally:
+            conn.close()
+            # Covers an unexpected crash of the loop as well as a normal stop:
+            # refuse new work first so nothing lands on the queue after it
+            # is failed, then wake producers blocked on the row bound
+            with self._cond:
+                self._stopped = True
+                self._queued_rows = 0
+                self._cond.notify_all()
+            self._fail_queued()
+
+    def _loop(self, conn: sqlite3.Connection) -> None:
+        pending: List[WriteOp] = []
+        markers: List[FlushMarker] = []
+        rows = 0
+        deadline = 0.0
+
+        try:
+            while True:
+                timeout = max(0.0, deadline - time.monotonic()) if pending else None
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = None
+
+                stop = item is _STOP
+                if isinstance(item, WriteOp):
+                    if not pending:
+                        deadline = time.monotonic() + self.batch_interval
+                    pending.append(item)
+                    rows += item.rows
+                elif isinstance(item, FlushMarker):
+                    markers.append(item)
+
+                if pending and (stop or markers or item is None or rows >= self.batch_rows):
+                    self._commit_group(conn, pending)
+                    self._release(rows)
+                    pending, rows = [], 0
+                if markers:
+                    self._resolve_markers(markers)
+                    markers = []
+
+                if stop:
+                    break
+        except BaseException as exc:
+            # Writes already taken off the queue will never commit now
+            for item in (*pending, *markers):
+                if not item.future.done():
+                    item.future.set_exception(RuntimeError(f"writer thread failed: {exc!r}"))
+            raise
+
+    def _resolve_markers(self, markers: Sequence[FlushMarker]) -> None:
+        # Every flush resolved in this round sees the error, so concurrent
+        # flushers cannot steal it from each other; drains leave it pending
+        error = self._error
+        if any(marker.report_errors for marker in markers):
+            self._error = None
+        for marker in markers:
+            marker.future.set_result(error if marker.report_errors else None)
+
+    def _commit_group(self, conn: sqlite3.Connection, ops: Sequence[WriteOp]) -> None:
+        try:
+            for op in ops:
+                self._apply(conn, op)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            # Replay one by one so a single bad write does not sink its group
+            for op in ops:
+                try:
+                    self._apply(conn, op)
+                    conn.commit()
+                except Exception as exc:
+                    conn.rollback()
+                    self._error = self._error or exc
+                    op.future.set_exception(exc)
+                else:
+                    op.future.set_result(None)
+            return
+
+        for op in ops:
+            op.future.set_result(None)
+
+    @staticmethod
+    def _apply(conn: sqlite3.Connection, op: WriteOp) -> None:
+        if op.many:
+            conn.executemany(op.sql, op.params)
+        else:
+            conn.execute(op.sql, op.params)
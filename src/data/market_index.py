@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+from src.models.schemas import Market
+
+
+def close_timestamp(market: Market) -> float:
+    """Market close time as a UTC epoch; naive datetimes are treated as UTC."""
+    close_time = market.close_time
+    if close_time.tzinfo is None:
+        close_time = close_time.replace(tzinfo=timezone.utc)
+    return close_time.timestamp()
+
+
+def _epoch(when: datetime) -> float:
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return when.timestamp()
+
+
+def is_pollable(close_ts: float, now: datetime) -> bool:
+    """Whether a market closing at epoch `close_ts` should still be polled at `now`.
+
+    This is the single expiry rule shared by `MarketIndex.expire` and the
+    columnar collector: a market expires once ``close_time <= now``.
+    """
+    return close_ts > _epoch(now)
+
+
+class MarketIndex:
+    """In-memory market universe ordered by close time.
+
+    Active markets are kept in a list sorted by ``(close_ts, id)`` so window
+    queries bisect in O(log n). `expire` pops closed markets off the front
+    and parks them in `awaiting_resolution` until an outcome arrives, so the
+    polling set only ever holds markets that can still trade.
+    """
+
+    def __init__(self, markets: Iterable[Market] = ()) -> None:
+        self._markets: Dict[str, Market] = {market.id: market for market in markets}
+        self.awaiting_resolution: Dict[str, Market] = {}
+        # Bulk load with one sort; `add` keeps the order for later inserts
+        self._order: List[Tuple[float, str]] = sorted((close_timestamp(market), market_id) for market_id, market in self._markets.items())
+
+    @classmethod
+    def from_store(cls, store) -> "MarketIndex":
+        """Build an index from every row in the store's `markets` table."""
+        return cls(store.fetch_markets())
+
+    def add(self, market: Market) -> None:
+        """Insert or replace a market, re-keying it if its close time moved."""
+        self.discard(market.id)
+        self.awaiting_resolution.pop(market.id, None)
+        self._markets[market.id] = market
+        insort(self._order, (close_timestamp(market), market.id))
+
+    def discard(self, market_id: str) -> None:
+        market = self._markets.pop(market_id, None)
+        if market is None:
+            return
+        key = (close_timestamp(market), market_id)
+        pos = bisect_left(self._order, key)
+        if pos < len(self._order) and self._order[pos] == key:
+            del self._order[pos]
+
+    def closing_between(self, start: datetime, end: datetime) -> List[Market]:
+        """Active markets with ``start <= close_time < end``, soonest first."""
+        lo = bisect_left(self._order, (_epoch(start), ""))
+        hi = bisect_left(self._order, (_epoch(end), ""), lo)
+        return [self._markets[market_id] for _, market_id in self._order[lo:hi]]
+
+    def expire(self, now: datetime) -> List[Market]:
+        """Move every market with ``close_time <= now`` out of the active set."""
+        cut = bisect_left(self._order, True, key=lambda entry: is_pollable(entry[0], now))
+        expired = [self._markets.pop(market_id) for _, market_id in self._order[:cut]]
+        del self._order[:cut]
+        for market in expired:
+            self.awaiting_resolution[market.id] = market
+        return expired
+
+    def mark_resolved(self, market_ids: Iterable[str]) -> Set[str]:
+        """Forget resolved markets; returns the ids that were being tracked."""
+        dropped: Set[str] = set()
+        for market_id in market_ids:
+            if self.awaiting_resolution.pop(market_id, None) is not None or market_id in self._markets:
+                self.discard(market_id)
+                dropped.add(market_id)
+        return dropped
+
+    def __contains__(self, market_id: object) -> bool:
+        return market_id in self._markets
+
+    def __iter__(self) -> Iterator[Market]:
+        return (self._markets[market_id] for _, market_id in self._order)
+
+    def __len__(self) -> int:
+        return len(self._order)
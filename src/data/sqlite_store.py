@@ -2,19 +2,49 @@ from __future__ import annotations
 
 import sqlite3
 from datetime import datetime, timezone
-from typing import List
+from typing import TYPE_CHECKING, Any, List, Optional
 
 from src.models.schemas import Market, Snapshot
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from src.data.decode import MarketBatch, SnapshotBatch
+    from src.data.group_writer import GroupCommitWriter
+
 
 class SQLiteStore:
-    """Lightweight SQLite wrapper for markets and snapshots."""
+    """Lightweight SQLite wrapper for markets and snapshots.
 
-    def __init__(self, db_path: str = "data/kalashi.db") -> None:
+    With ``async_writes=True`` inserts are handed to a `GroupCommitWriter`
+    thread and return a future that resolves once the row is committed;
+    reads wait for queued writes first so callers still see their own rows.
+    Write errors surface through those futures and `flush()`, never reads.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "data/kalashi.db",
+        async_writes: bool = False,
+        batch_rows: int = 500,
+        batch_interval: float = 0.05,
+        max_queue_rows: int = 10_000,
+    ) -> None:
+        if async_writes and db_path == ":memory:":
+            raise ValueError("async_writes needs a file-backed database")
         self.db_path = db_path
         self.conn = sqlite3.connect(self.db_path)
         self.conn.row_factory = sqlite3.Row
         self._ensure_tables()
+        self.writer: Optional[GroupCommitWriter] = None
+        if async_writes:
+            from src.data.group_writer import GroupCommitWriter
+
+            # WAL lets this connection read while the writer thread commits
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.writer = GroupCommitWriter(
+                db_path, batch_rows=batch_rows, batch_interval=batch_interval, max_queue_rows=max_queue_rows
+            )
 
     def _ensure_tables(self) -> None:
         cursor = self.conn.cursor()
@@ -44,13 +74,32 @@ class SQLiteStore:
         )
         self.conn.commit()
 
-    def upsert_market(self, market: Market) -> None:
+    def _write(self, sql: str, params: Any, many: bool = False) -> Optional[Future]:
+        if self.writer is not None:
+            return self.writer.submit(sql, params, many=many)
+        if many:
+            self.conn.executemany(sql, params)
+        else:
+            self.conn.execute(sql, params)
+        self.conn.commit()
+        return None
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait until every queued write is committed (no-op for sync writes)."""
+        if self.writer is not None:
+            self.writer.flush(timeout=timeout)
+
+    def _drain(self) -> None:
+        if self.writer is not None:
+            self.writer.drain()
+
+    def upsert_market(self, market: Market) -> Optional[Future]:
         """Insert or update a market record."""
         validated = market if isinstance(market, Market) else Market.model_validate(market)
         payload = validated.model_dump()
         close_time = payload["close_time"].isoformat()
 
-        self.conn.execute(
+        return self._write(
             """
             INSERT INTO markets(id, question, close_time, resolution_source)
             VALUES (:id, :question, :close_time, :resolution_source)
@@ -66,9 +115,8 @@ class SQLiteStore:
                 "resolution_source": payload["resolution_source"],
             },
         )
-        self.conn.commit()
 
-    def insert_snapshot(self, snapshot: Snapshot) -> None:
+    def insert_snapshot(self, snapshot: Snapshot) -> Optional[Future]:
         """Insert a validated snapshot row."""
         snap = snapshot if isinstance(snapshot, Snapshot) else Snapshot.model_validate(snapshot)
         ts = snap.ts
@@ -76,7 +124,7 @@ class SQLiteStore:
             ts = ts.replace(tzinfo=timezone.utc)
         epoch_ms = int(ts.timestamp() * 1000)
 
-        self.conn.execute(
+        return self._write(
             """
             INSERT INTO snapshots(market_id, ts, bid, ask, last, volume)
             VALUES (:market_id, :ts, :bid, :ask, :last, :volume)
@@ -90,9 +138,48 @@ class SQLiteStore:
                 "volume": snap.volume,
             },
         )
-        self.conn.commit()
+
+    def upsert_market_batch(self, batch: "MarketBatch") -> Optional[Future]:
+        """Upsert a pre-decoded column batch of markets in one transaction."""
+        return self._write(
+            """
+            INSERT INTO markets(id, question, close_time, resolution_source)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                question=excluded.question,
+                close_time=excluded.close_time,
+                resolution_source=excluded.resolution_source
+            """,
+            batch.rows(),
+            many=True,
+        )
+
+    def insert_snapshot_batch(self, batch: "SnapshotBatch") -> Optional[Future]:
+        """Insert a pre-validated column batch of snapshots in one transaction."""
+        return self._write(
+            """
+            INSERT INTO snapshots(market_id, ts, bid, ask, last, volume)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            batch.rows(),
+            many=True,
+        )
+
+    def fetch_markets(self) -> List[Market]:
+        self._drain()
+        cursor = self.conn.execute("SELECT id, question, close_time, resolution_source FROM markets")
+        return [
+            Market(
+                id=row["id"],
+                question=row["question"],
+                close_time=datetime.fromisoformat(row["close_time"]),
+                resolution_source=row["resolution_source"],
+            )
+            for row in cursor.fetchall()
+        ]
 
     def fetch_latest_snapshots(self, limit: int = 10) -> List[Snapshot]:
+        self._drain()
         cursor = self.conn.execute(
             """
             SELECT market_id, ts, bid, ask, last, volume
@@ -119,6 +206,8 @@ class SQLiteStore:
         return snapshots
 
     def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
         self.conn.close()
 
     def __enter__(self) -> "SQLiteStore":
@@ -1,5 +1,31 @@
 """Paper execution simulators."""
 
-from .paper_trader import PaperTrader, Position
+from typing import TYPE_CHECKING
 
-__all__ = ["PaperTrader", "Position"]
+from src._lazy import lazy_exports
+
+__all__ = [
+    "PaperTrader",
+    "Position",
+    "RiskReport",
+    "monte_carlo_risk",
+    "settlement_sweep",
+    "simulate_pnl",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "PaperTrader": "paper_trader",
+        "Position": "paper_trader",
+        "RiskReport": "risk",
+        "monte_carlo_risk": "risk",
+        "settlement_sweep": "settlement",
+        "simulate_pnl": "risk",
+    },
+)
+
+if TYPE_CHECKING:
+    from .paper_trader import PaperTrader, Position
+    from .risk import RiskReport, monte_carlo_risk, simulate_pnl
+    from .settlement import settlement_sweep
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from src.models.schemas import Outcome, TradeDecision
 
@@ -44,6 +44,8 @@ class PaperTrader:
         self.positions: Dict[str, Position] = {}
         self.decision_log: List[DecisionLog] = []
         self.outcomes: List[Outcome] = []
+        # decision_log index of the fill behind each open position
+        self._entry_log_index: Dict[str, int] = {}
 
     def _position_risk(self, decision: TradeDecision) -> float:
         side = decision.side.upper()
@@ -84,13 +86,20 @@ class PaperTrader:
             opened_at=decision.ts,
         )
         self.positions[decision.market_id] = position
+        self._entry_log_index[decision.market_id] = len(self.decision_log) - 1
         return position
 
+    def entry_decision(self, market_id: str) -> Optional[TradeDecision]:
+        """The filled decision that opened the current position in `market_id`."""
+        index = self._entry_log_index.get(market_id)
+        return self.decision_log[index][0] if index is not None else None
+
     def settle(self, outcome: Outcome) -> Outcome:
         """Resolve a position and update bankroll and realized PnL."""
         position = self.positions.pop(outcome.market_id, None)
         if position is None:
             raise ValueError(f"No open position for market {outcome.market_id}")
+        self._entry_log_index.pop(outcome.market_id, None)
 
         side = position.side.upper()
 
@@ -109,5 +118,9 @@ class PaperTrader:
         self.outcomes.append(resolved)
         return resolved
 
+    def settle_batch(self, outcomes: Iterable[Outcome]) -> List[Outcome]:
+        """Settle every outcome that has an open position; others are ignored."""
+        return [self.settle(outcome) for outcome in outcomes if outcome.market_id in self.positions]
+
     def open_position_count(self) -> int:
         return len(self.positions)
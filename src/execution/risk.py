@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from src.execution.paper_trader import Position
+from src.models.schemas import TradeDecision
+
+# Outcome draws use 32-bit uniforms: two per raw 64-bit generator word, which
+# is cheaper than float draws. Probabilities are rounded to the nearest 2**-32,
+# fine enough to keep rare tail events; markets that round to 0 or 1 are
+# handled deterministically.
+_DRAW_SCALE = 1 << 32
+_CHUNK_ROWS = 2048
+
+
+@dataclass
+class RiskReport:
+    """Simulated portfolio PnL distribution and tail statistics.
+
+    Loss figures (`var`, `cvar`, `daily_loss_cap`) are positive amounts.
+    """
+
+    pnl: np.ndarray
+    expected_pnl: float
+    var: float
+    cvar: float
+    confidence: float
+    daily_loss_cap: Optional[float]
+    breach_probability: float
+
+
+def _payoff_vectors(
+    positions: Iterable[Position], probabilities: Mapping[str, float]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (pnl if NO resolves, pnl delta if YES resolves, P(YES)) per position."""
+    base: List[float] = []
+    delta: List[float] = []
+    probs: List[float] = []
+    for position in positions:
+        if position.market_id not in probabilities:
+            raise ValueError(f"No probability for market {position.market_id}")
+        p = float(probabilities[position.market_id])
+        if not 0 <= p <= 1:
+            raise ValueError(f"Probability for market {position.market_id} must be in [0, 1]")
+
+        risk = position.risk()
+        if position.side.upper() == "YES":
+            base.append(-risk)
+            delta.append(position.size)
+        else:
+            base.append(position.size - risk)
+            delta.append(-position.size)
+        probs.append(p)
+
+    return np.asarray(base), np.asarray(delta), np.asarray(probs)
+
+
+def _decision_position(decision: TradeDecision) -> Position:
+    return Position(
+        market_id=decision.market_id,
+        side=decision.side.upper(),
+        entry_price=decision.price,
+        size=decision.size,
+        opened_at=decision.ts,
+    )
+
+
+def simulate_pnl(
+    positions: Iterable[Position],
+    probabilities: Mapping[str, float],
+    n_scenarios: int = 100_000,
+    seed: Optional[int] = None,
+) -> np.ndarray:
+    """Simulate joint resolutions and return the portfolio PnL per scenario.
+
+    Markets resolve independently with P(YES) taken from `probabilities`
+    (keyed by market id). PnL is measured against the capital already
+    committed at entry, matching `PaperTrader.settle`.
+    """
+    if n_scenarios <= 0:
+        raise ValueError("n_scenarios must be positive")
+
+    base, delta, probs = _payoff_vectors(positions, probabilities)
+    pnl = np.full(n_scenarios, base.sum())
+
+    # Outcomes that round to certain contribute a constant and need no draws;
+    # this also keeps every remaining threshold inside uint32.
+    thresholds = np.round(probs * _DRAW_SCALE)
+    pnl += delta[thresholds >= _DRAW_SCALE].sum()
+    uncertain = (thresholds > 0) & (thresholds < _DRAW_SCALE)
+    if not uncertain.any():
+        return pnl
+
+    delta = delta[uncertain].astype(np.float32)
+    thresholds = thresholds[uncertain].astype(np.uint32)
+    k = len(delta)
+
+    bit_generator = np.random.default_rng(seed).bit_generator
+    hits = np.empty((min(_CHUNK_ROWS, n_scenarios), k), dtype=np.float32)
+    # Chunking keeps the working set cache-resident; one pass per chunk.
+    for start in range(0, n_scenarios, _CHUNK_ROWS):
+        rows = min(_CHUNK_ROWS, n_scenarios - start)
+        draws = bit_generator.random_raw(-(-rows * k // 2)).view(np.uint32)[: rows * k]
+        block = hits[:rows]
+        np.less(draws.reshape(rows, k), thresholds, out=block, casting="unsafe")
+        pnl[start : start + rows] += block @ delta
+
+    return pnl
+
+
+def monte_carlo_risk(
+    positions: Iterable[Position],
+    probabilities: Mapping[str, float],
+    daily_loss_cap: Optional[float] = None,
+    realized_pnl: float = 0.0,
+    confidence: float = 0.95,
+    n_scenarios: int = 100_000,
+    candidate: Optional[TradeDecision] = None,
+    seed: Optional[int] = None,
+) -> RiskReport:
+    """Summarize the simulated PnL distribution of open positions.
+
+    `realized_pnl` is the PnL already booked today; a scenario breaches the
+    daily cap when `realized_pnl + pnl <= -daily_loss_cap`. Pass `candidate`
+    to evaluate the portfolio as if that decision had been filled.
+    """
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    if daily_loss_cap is not None and daily_loss_cap <= 0:
+        raise ValueError("daily_loss_cap must be positive")
+
+    positions = list(positions)
+    if candidate is not None:
+        positions.append(_decision_position(candidate))
+
+    pnl = simulate_pnl(positions, probabilities, n_scenarios=n_scenarios, seed=seed)
+
+    var = -float(np.quantile(pnl, 1 - confidence))
+    cvar = -float(pnl[pnl <= -var].mean())
+    breach_probability = 0.0
+    if daily_loss_cap is not None:
+        breach_probability = float(np.mean(realized_pnl + pnl <= -daily_loss_cap))
+
+    return RiskReport(
+        pnl=pnl,
+        expected_pnl=float(pnl.mean()),
+        var=var,
+        cvar=cvar,
+        confidence=confidence,
+        daily_loss_cap=daily_loss_cap,
+        breach_probability=breach_probability,
+    )
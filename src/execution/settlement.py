@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Mapping, Optional
+
+from src.data.market_index import MarketIndex
+from src.execution.paper_trader import PaperTrader
+from src.models.schemas import Outcome
+
+if TYPE_CHECKING:
+    from src.reporting.report_store import ReportStore
+
+
+def settlement_sweep(
+    index: MarketIndex,
+    trader: PaperTrader,
+    resolutions: Mapping[str, int],
+    now: datetime,
+    reports: Optional[ReportStore] = None,
+) -> List[Outcome]:
+    """Expire closed markets and batch-settle positions for newly resolved ones.
+
+    `resolutions` holds only outcomes that arrived since the last sweep
+    (market id -> resolved YES value), so a tick costs O(expired + resolved)
+    rather than O(all markets ever seen). When `reports` is given, each
+    settled outcome is recorded there with the decision that opened it.
+    """
+    index.expire(now)
+    entries = {market_id: trader.entry_decision(market_id) for market_id in resolutions}
+    settled = trader.settle_batch(
+        Outcome(market_id=market_id, resolved_value=value, pnl=0) for market_id, value in resolutions.items()
+    )
+    index.mark_resolved(resolutions)
+    if reports is not None and settled:
+        reports.record_settlements((outcome, entries[outcome.market_id], now) for outcome in settled)
+    return settled
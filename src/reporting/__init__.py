@@ -0,0 +1,21 @@
+"""Incremental reporting aggregates and charts."""
+
+from typing import TYPE_CHECKING
+
+from src._lazy import lazy_exports
+
+__all__ = ["ReportStore", "ReportSummary", "parse_edge", "render_weekly_report"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ReportStore": "report_store",
+        "ReportSummary": "report_store",
+        "parse_edge": "report_store",
+        "render_weekly_report": "weekly",
+    },
+)
+
+if TYPE_CHECKING:
+    from .report_store import ReportStore, ReportSummary, parse_edge
+    from .weekly import render_weekly_report
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import math
+import re
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Tuple
+
+from src.models.schemas import Outcome, TradeDecision
+
+_EDGE_RE = re.compile(r"edge=(-?\d+(?:\.\d+)?)")
+_P_HAT_RE = re.compile(r"p_hat=(-?\d+(?:\.\d+)?)")
+
+
+def parse_edge(decision: TradeDecision) -> Optional[float]:
+    """Recover the entry edge from a decision's reason string.
+
+    Uses ``edge=`` when present, else ``p_hat - price``; None if neither is
+    available (e.g. manual trades).
+    """
+    match = _EDGE_RE.search(decision.reason)
+    if match:
+        return float(match.group(1))
+    match = _P_HAT_RE.search(decision.reason)
+    if match:
+        return float(match.group(1)) - decision.price
+    return None
+
+
+def _epoch_ms(ts: datetime) -> int:
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return int(ts.timestamp() * 1000)
+
+
+@dataclass
+class EquityPoint:
+    ts: datetime
+    market_id: str
+    pnl: float
+    equity: float
+    drawdown: float
+
+
+@dataclass
+class ReportSummary:
+    equity: float
+    peak: float
+    drawdown: float
+    max_drawdown: float
+    trades: int
+
+
+class ReportStore:
+    """Incrementally maintained reporting aggregates backed by SQLite.
+
+    Every settled trade appends one equity-curve point (with running peak and
+    drawdown) and bumps one edge-histogram bin, so rendering a report only
+    reads the rows it plots rather than replaying the trade history.
+    """
+
+    def __init__(self, db_path: str = "data/kalashi.db", starting_equity: float = 0.0, bin_width: float = 0.01) -> None:
+        if bin_width <= 0:
+            raise ValueError("bin_width must be positive")
+        self.db_path = db_path
+        self.bin_width = bin_width
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.row_factory = sqlite3.Row
+        self._ensure_tables(starting_equity)
+
+    def _ensure_tables(self, starting_equity: float) -> None:
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS report_equity (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ts INTEGER NOT NULL,
+                market_id TEXT NOT NULL,
+                pnl REAL NOT NULL,
+                equity REAL NOT NULL,
+                peak REAL NOT NULL,
+                drawdown REAL NOT NULL
+            )
+            """
+        )
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_report_equity_ts ON report_equity(ts)")
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS report_edge_hist (
+                bin INTEGER PRIMARY KEY,
+                trades INTEGER NOT NULL,
+                wins INTEGER NOT NULL,
+                pnl REAL NOT NULL
+            )
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS report_state (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                equity REAL NOT NULL,
+                peak REAL NOT NULL,
+                max_drawdown REAL NOT NULL,
+                trades INTEGER NOT NULL
+            )
+            """
+        )
+        cursor.execute(
+            "INSERT OR IGNORE INTO report_state(id, equity, peak, max_drawdown, trades) VALUES (1, ?, ?, 0, 0)",
+            (starting_equity, starting_equity),
+        )
+        self.conn.commit()
+
+    def summary(self) -> ReportSummary:
+        row = self._state_row()
+        return ReportSummary(
+            equity=row["equity"],
+            peak=row["peak"],
+            drawdown=row["peak"] - row["equity"],
+            max_drawdown=row["max_drawdown"],
+            trades=row["trades"],
+        )
+
+    def _state_row(self) -> sqlite3.Row:
+        return self.conn.execute("SELECT equity, peak, max_drawdown, trades FROM report_state WHERE id = 1").fetchone()
+
+    def record_settlement(self, outcome: Outcome, decision: Optional[TradeDecision], ts: datetime) -> None:
+        """Fold one settled trade into the aggregates."""
+        self.record_settlements([(outcome, decision, ts)])
+
+    def record_settlements(self, items: Iterable[Tuple[Outcome, Optional[TradeDecision], datetime]]) -> None:
+        """Fold a batch of settled trades into the aggregates in one transaction."""
+        with self.conn:
+            # Take the write lock before reading the running state, so another
+            # writer on the same database cannot fold onto the same base
+            self.conn.execute("BEGIN IMMEDIATE")
+            state = self._state_row()
+            equity, peak, max_drawdown, trades = state["equity"], state["peak"], state["max_drawdown"], state["trades"]
+
+            for outcome, decision, ts in items:
+                equity += outcome.pnl
+                peak = max(peak, equity)
+                drawdown = peak - equity
+                max_drawdown = max(max_drawdown, drawdown)
+                trades += 1
+                self.conn.execute(
+                    """
+                    INSERT INTO report_equity(ts, market_id, pnl, equity, peak, drawdown)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (_epoch_ms(ts), outcome.market_id, outcome.pnl, equity, peak, drawdown),
+                )
+
+                edge = parse_edge(decision) if decision is not None else None
+                if edge is not None:
+                    self.conn.execute(
+                        """
+                        INSERT INTO report_edge_hist(bin, trades, wins, pnl) VALUES (?, 1, ?, ?)
+                        ON CONFLICT(bin) DO UPDATE SET
+                            trades=trades + 1,
+                            wins=wins + excluded.wins,
+                            pnl=pnl + excluded.pnl
+                        """,
+                        (math.floor(round(edge / self.bin_width, 9)), int(outcome.pnl > 0), outcome.pnl),
+                    )
+
+            self.conn.execute(
+                "UPDATE report_state SET equity = ?, peak = ?, max_drawdown = ?, trades = ? WHERE id = 1",
+                (equity, peak, max_drawdown, trades),
+            )
+
+    def equity_curve(self, since: Optional[datetime] = None) -> List[EquityPoint]:
+        cursor = self.conn.execute(
+            """
+            SELECT ts, market_id, pnl, equity, drawdown
+            FROM report_equity
+            WHERE ts >= ?
+            ORDER BY id
+            """,
+            (_epoch_ms(since) if since is not None else 0,),
+        )
+        return [
+            EquityPoint(
+                ts=datetime.fromtimestamp(row["ts"] / 1000, tz=timezone.utc),
+                market_id=row["market_id"],
+                pnl=row["pnl"],
+                equity=row["equity"],
+                drawdown=row["drawdown"],
+            )
+            for row in cursor.fetchall()
+        ]
+
+    def edge_histogram(self) -> List[Tuple[float, int, int, float]]:
+        """Rows of ``(bin lower edge, trades, wins, pnl)`` ordered by edge."""
+        cursor = self.conn.execute("SELECT bin, trades, wins, pnl FROM report_edge_hist ORDER BY bin")
+        return [(row["bin"] * self.bin_width, row["trades"], row["wins"], row["pnl"]) for row in cursor.fetchall()]
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "ReportStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from src.reporting.report_store import ReportStore
+
+
+def render_weekly_report(
+    store: ReportStore,
+    out_dir: str = "reports",
+    now: Optional[datetime] = None,
+    days: int = 7,
+) -> Dict[str, str]:
+    """Plot bankroll, drawdown and edge histogram charts for the last `days`.
+
+    Reads only the precomputed aggregates, so cost tracks the report window.
+    Returns a mapping of chart name to written PNG path.
+    """
+    # A bare Figure renders without pyplot, so callers keep their own backend
+    from matplotlib.figure import Figure
+
+    now = now or datetime.now(tz=timezone.utc)
+    points = store.equity_curve(since=now - timedelta(days=days))
+    hist = store.edge_histogram()
+    os.makedirs(out_dir, exist_ok=True)
+    paths: Dict[str, str] = {}
+
+    times = [p.ts for p in points]
+    for name, values, title in (
+        ("bankroll", [p.equity for p in points], "Bankroll"),
+        ("drawdown", [-p.drawdown for p in points], "Drawdown from peak"),
+    ):
+        fig = Figure(figsize=(8, 3))
+        ax = fig.subplots()
+        ax.step(times, values, where="post")
+        ax.set_title(f"{title} ({days}d)")
+        fig.autofmt_xdate()
+        paths[name] = os.path.join(out_dir, f"{name}.png")
+        fig.savefig(paths[name], bbox_inches="tight")
+
+    fig = Figure(figsize=(8, 3))
+    ax = fig.subplots()
+    ax.bar([edge for edge, *_ in hist], [trades for _, trades, _, _ in hist], width=store.bin_width, align="edge")
+    ax.set_title("Entry edge histogram (all time)")
+    ax.set_xlabel("edge")
+    ax.set_ylabel("trades")
+    paths["edge_hist"] = os.path.join(out_dir, "edge_hist.png")
+    fig.savefig(paths["edge_hist"], bbox_inches="tight")
+
+    return paths
@@ -3,12 +3,19 @@ from __future__ import annotations
 import argparse
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Iterable, List, Tuple
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
 
-from src.api.kalshi_client import KalshiClient, KalshiHTTPError
+from src.data.market_index import MarketIndex, is_pollable
 from src.data.sqlite_store import SQLiteStore
 from src.models.schemas import Market, Snapshot
 
+if TYPE_CHECKING:
+    from src.api.kalshi_client import KalshiClient
+    from src.data.decode import MarketBatch, SnapshotBatch
+
+# HTTP clients and decoders are imported inside the live-collection paths so
+# short sample/cron passes do not pay for requests, aiohttp or orjson.
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,67 +54,152 @@ def _parse_market(raw: dict) -> Market:
     )
 
 
+def _split_pages(client: KalshiClient, limit: int) -> Tuple[List[dict], List[dict]]:
+    """Raw markets from changed pages and from pages the cache reports unchanged."""
+    changed: List[dict] = []
+    unchanged: List[dict] = []
+    for page in client.iter_market_pages(limit=limit):
+        (unchanged if page.unchanged else changed).extend(page.markets)
+    return changed, unchanged
+
+
+def _pollable_unchanged(unchanged: List[dict], now: datetime) -> List[str]:
+    from src.data.decode import decode_poll_keys
+
+    ids, close_ts = decode_poll_keys(unchanged)
+    return [market_id for market_id, ts in zip(ids, close_ts) if is_pollable(ts, now)]
+
+
 def collect_from_api(client: KalshiClient, limit: int = 10) -> Tuple[List[Market], List[Snapshot]]:
-    markets: List[Market] = []
+    """Parse changed market pages and snapshot every open market's orderbook.
+
+    Markets on pages served from cache or by a 304 are polled but neither
+    parsed nor returned: their rows were stored when the page last changed.
+    """
+    from src.api.kalshi_client import KalshiHTTPError
+    from src.data.decode import orderbook_quotes
+
+    changed, unchanged = _split_pages(client, limit)
+    markets = [_parse_market(raw_market) for raw_market in changed]
     snapshots: List[Snapshot] = []
 
-    for raw_market in client.get_markets_paginated(limit=limit):
-        market = _parse_market(raw_market)
-        markets.append(market)
+    index = MarketIndex(markets)
+
+    # Closed markets keep their metadata row but are no longer polled
+    now = datetime.now(tz=timezone.utc)
+    index.expire(now)
 
+    for market_id in [market.id for market in index] + _pollable_unchanged(unchanged, now):
         # Build a thin snapshot from the orderbook best bid/ask if available
         try:
-            orderbook = client.get_market_orderbook(market.id)
-            bids = orderbook.get("orderbook", {}).get("yes", [])
-            asks = orderbook.get("orderbook", {}).get("no", [])
-            best_bid = bids[0][0] if bids else 0.0
-            best_ask = asks[0][0] if asks else max(best_bid, 0.01)
-            last = orderbook.get("last_price", best_bid or best_ask)
+            orderbook = client.get_market_orderbook(market_id)
         except KalshiHTTPError:
             # If the orderbook call fails for a specific market, skip its snapshot
             continue
 
+        bid, ask, last, volume = orderbook_quotes(orderbook)
         snapshots.append(
             Snapshot(
-                market_id=market.id,
+                market_id=market_id,
                 ts=datetime.now(tz=timezone.utc),
-                bid=best_bid,
-                ask=max(best_ask, best_bid),
+                bid=bid,
+                ask=ask,
                 last=last,
-                volume=int(orderbook.get("volume", 0)),
+                volume=volume,
             )
         )
 
     return markets, snapshots
 
 
-def run(db_path: str = "data/kalashi.db", sample_only: bool = True, page_limit: int = 10) -> None:
+def collect_batches_from_api(client: KalshiClient, limit: int = 10) -> Tuple[MarketBatch, SnapshotBatch]:
+    """Columnar variant of `collect_from_api` that skips per-row model construction."""
+    from src.api.kalshi_client import KalshiHTTPError
+    from src.data.decode import decode_markets, decode_orderbooks
+
+    changed, unchanged = _split_pages(client, limit)
+    market_batch = decode_markets(changed)
+    now = datetime.now(tz=timezone.utc)
+
+    poll_ids = [
+        market_id for market_id, close_ts in zip(market_batch.id, market_batch.close_ts) if is_pollable(close_ts, now)
+    ]
+    books = []
+    for market_id in poll_ids + _pollable_unchanged(unchanged, now):
+        try:
+            books.append((market_id, client.get_market_orderbook(market_id)))
+        except KalshiHTTPError:
+            continue
+
+    snapshot_batch = decode_orderbooks(books, ts=now)
+    if snapshot_batch.rejected:
+        logger.warning("Dropped %d invalid orderbook snapshots", len(snapshot_batch.rejected))
+    return market_batch, snapshot_batch
+
+
+def run(
+    db_path: str = "data/kalashi.db",
+    sample_only: bool = True,
+    page_limit: int = 10,
+    cache_path: str | None = None,
+    fast_decode: bool = False,
+) -> None:
     """Single-run snapshot + upsert flow.
 
     Defaults to offline sample data so the runner can be exercised without
-    network access. Pass `sample_only=False` to attempt live collection.
+    network access. Pass `sample_only=False` to attempt live collection;
+    `cache_path` persists the market metadata cache between runs and
+    `fast_decode` switches live collection to the columnar batch path.
+    Market pages the cache reports unchanged are not re-upserted, so a
+    persisted cache should always be paired with the same `db_path`.
     """
 
     store = SQLiteStore(db_path)
     markets: List[Market]
     snapshots: List[Snapshot]
+    batches: Optional[Tuple[MarketBatch, SnapshotBatch]] = None
 
     if sample_only:
         markets, snapshots = _sample_data()
     else:
+        from src.api.cache import ResponseCache
+        from src.api.kalshi_client import KalshiClient, KalshiHTTPError
+        from src.data.decode import loads
+
+        cache = ResponseCache(persist_path=cache_path)
         try:
-            client = KalshiClient()
-            markets, snapshots = collect_from_api(client, limit=page_limit)
+            client = KalshiClient(cache=cache, json_loads=loads if fast_decode else None)
+            if fast_decode:
+                batches = collect_batches_from_api(client, limit=page_limit)
+            else:
+                markets, snapshots = collect_from_api(client, limit=page_limit)
         except KalshiHTTPError as exc:
             logger.warning("Falling back to sample data after API error: %s", exc)
             markets, snapshots = _sample_data()
+        stats = cache.stats
+        logger.info(
+            "Metadata cache: hit rate %.0f%% (%d fresh, %d revalidated, %d fetched), %d bytes saved",
+            stats.hit_rate * 100,
+            stats.hits,
+            stats.revalidated,
+            stats.misses,
+            stats.bytes_saved,
+        )
+        cache.save()
+
+    if batches is not None:
+        market_batch, snapshot_batch = batches
+        store.upsert_market_batch(market_batch)
+        store.insert_snapshot_batch(snapshot_batch)
+        for market_id in snapshot_batch.market_id:
+            print(f"Snapshot saved for {market_id}")
+    else:
+        for market in markets:
+            store.upsert_market(market)
 
-    for market in markets:
-        store.upsert_market(market)
-
-    for snap in snapshots:
-        store.insert_snapshot(snap)
-        print(f"Snapshot saved for {snap.market_id}")
+        for snap in snapshots:
+            store.insert_snapshot(snap)
+            print(f"Snapshot saved for {snap.market_id}")
 
     store.close()
 
@@ -116,11 +208,20 @@ def main(argv: Iterable[str] | None = None) -> None:
     parser = argparse.ArgumentParser(description="Run a single Kakashi data collection loop")
     parser.add_argument("--db", dest="db_path", default="data/kalashi.db")
     parser.add_argument("--live", dest="sample_only", action="store_false", help="Use Kalshi API instead of sample data")
+    parser.add_argument("--sample", dest="sample_only", action="store_true", help="Use offline sample data (default)")
     parser.add_argument("--limit", dest="page_limit", type=int, default=10)
+    parser.add_argument("--cache", dest="cache_path", default=None, help="Persist market metadata cache to this file")
+    parser.add_argument("--fast-decode", action="store_true", help="Decode live payloads straight into column batches")
     args = parser.parse_args(list(argv) if argv is not None else None)
 
     logging.basicConfig(level=logging.INFO)
-    run(db_path=args.db_path, sample_only=args.sample_only, page_limit=args.page_limit)
+    run(
+        db_path=args.db_path,
+        sample_only=args.sample_only,
+        page_limit=args.page_limit,
+        cache_path=args.cache_path,
+        fast_decode=args.fast_decode,
+    )
 
 
 if __name__ == "__main__":
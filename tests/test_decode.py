@@ -0,0 +1,91 @@
+from datetime import datetime, timezone
+
+from src.data.decode import decode_markets, decode_orderbooks, loads
+from src.data.sqlite_store import SQLiteStore
+from src.runner import _parse_market
+
+RAW_MARKETS = [
+    {"id": "A", "title": "A?", "close_time": "2030-01-01T00:00:00Z", "resolution_source": "kalshi"},
+    {"id": "B", "question": "B?", "close_time": "2030-01-01T00:00:00Z"},
+    {"id": "C", "question": "C?", "close_time_str": "2030-01-02T12:00:00"},
+]
+
+
+def test_loads_accepts_bytes_and_str():
+    assert loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+    assert loads('{"a": null}') == {"a": None}
+
+
+def test_decode_markets_matches_pydantic_path():
+    batch = decode_markets(RAW_MARKETS)
+    for i, raw in enumerate(RAW_MARKETS):
+        market = _parse_market(raw)
+        assert batch.id[i] == market.id
+        assert batch.question[i] == market.question
+        assert batch.close_time[i] == market.close_time.isoformat()
+        assert batch.resolution_source[i] == market.resolution_source
+    assert batch.close_ts[2] == datetime(2030, 1, 2, 12, tzinfo=timezone.utc).timestamp()
+
+
+def test_decode_orderbooks_drops_invalid_rows():
+    books = [
+        ("A", {"orderbook": {"yes": [[0.4, 10]], "no": [[0.45, 5]]}, "volume": 7}),
+        ("B", {"orderbook": {"yes": [[41, 10]], "no": []}}),
+        ("C", {"orderbook": {"yes": [[0.4, 1]], "no": [[0.5, 1]]}, "last_price": None}),
+        ("D", {"orderbook": {"yes": [["0.4", 1]], "no": [[0.5, 1]]}}),
+        ("E", {"orderbook": {"yes": [[None, 1]], "no": []}}),
+        ("F", {"orderbook": {"yes": [[0.4, 1]], "no": [[0.5, 1]]}, "volume": "lots"}),
+        ("G", {"orderbook": {"yes": [[0.4, 1]], "no": [[0.5, 1]]}, "volume": None}),
+        ("H", {"orderbook": {"yes": [[]], "no": []}}),
+    ]
+    batch = decode_orderbooks(books, ts=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    assert list(batch.rows()) == [("A", 1704067200000, 0.4, 0.45, 0.4, 7)]
+    assert batch.rejected == ["B", "C", "D", "E", "F", "G", "H"]
+
+
+def test_batch_inserts(tmp_path):
+    store = SQLiteStore(str(tmp_path / "k.db"))
+    store.upsert_market_batch(decode_markets(RAW_MARKETS))
+    books = [("A", {"orderbook": {"yes": [[0.1, 1]], "no": [[0.2, 1]]}, "last_price": 0.15})]
+    store.insert_snapshot_batch(decode_orderbooks(books, ts=datetime(2024, 1, 1, 0, 0, 1)))
+
+    assert sorted(m.id for m in store.fetch_markets()) == ["A", "B", "C"]
+    latest = store.fetch_latest_snapshots(limit=1)
+    assert latest[0].market_id == "A"
+    assert latest[0].last == 0.15
+    store.close()
+
+
+def test_both_collectors_poll_the_same_open_markets():
+    from src.api.kalshi_client import MarketPage
+    from src.runner import collect_batches_from_api, collect_from_api
+
+    class FakeClient:
+        def __init__(self):
+            self.polled = []
+
+        def iter_market_pages(self, limit=10):
+            yield MarketPage(
+                [
+                    {"id": "OPEN", "question": "?", "close_time": "2999-01-01T00:00:00Z"},
+                    {"id": "CLOSED", "question": "?", "close_time": "2000-01-01T00:00:00Z"},
+                ]
+            )
+            # Served from cache: polled, but not parsed or returned for upsert
+            yield MarketPage(
+                [
+                    {"id": "KEPT", "question": "?", "close_time": "2999-01-01T00:00:00Z"},
+                    {"id": "KEPT-CLOSED", "question": "?", "close_time": "2000-01-01T00:00:00Z"},
+                ],
+                unchanged=True,
+            )
+
+        def get_market_orderbook(self, ticker):
+            self.polled.append(ticker)
+            return {"orderbook": {"yes": [[0.4, 1]], "no": [[0.5, 1]]}}
+
+    slow, fast = FakeClient(), FakeClient()
+    markets, _ = collect_from_api(slow)
+    batch, _ = collect_batches_from_api(fast)
+    assert slow.polled == fast.polled == ["OPEN", "KEPT"]
+    assert [m.id for m in markets] == batch.id == ["OPEN", "CLOSED"]
@@ -0,0 +1,181 @@
+from datetime import datetime
+
+import pytest
+
+from src.data.sqlite_store import SQLiteStore
+from src.models.schemas import Market, Snapshot
+
+
+def make_snapshot(i: int) -> Snapshot:
+    return Snapshot(market_id="M1", ts=datetime(2024, 1, 1, 0, 0, i % 60), bid=0.1, ask=0.2, last=0.15, volume=i)
+
+
+def test_async_writes_commit_in_groups_and_resolve_futures(tmp_path):
+    store = SQLiteStore(str(tmp_path / "k.db"), async_writes=True, batch_rows=50, batch_interval=10)
+    store.upsert_market(
+        Market(id="M1", question="Test?", close_time=datetime(2024, 1, 1), resolution_source="unit-test")
+    )
+    futures = [store.insert_snapshot(make_snapshot(i)) for i in range(120)]
+
+    # The first 50 rows fill a group without waiting for the interval
+    futures[48].result(timeout=5)
+    store.flush()
+    assert all(f.done() and f.exception() is None for f in futures)
+    assert store.conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0] == 120
+    store.close()
+
+
+def test_interval_commits_partial_group_and_close_drains(tmp_path):
+    db_path = str(tmp_path / "k.db")
+    store = SQLiteStore(db_path, async_writes=True, batch_rows=1000, batch_interval=0.01)
+    store.insert_snapshot(make_snapshot(1)).result(timeout=5)
+
+    store.insert_snapshot(make_snapshot(2))
+    store.close()
+    with SQLiteStore(db_path) as reopened:
+        assert len(reopened.fetch_latest_snapshots(limit=10)) == 2
+
+
+def test_failed_write_only_fails_its_own_future(tmp_path):
+    store = SQLiteStore(str(tmp_path / "k.db"), async_writes=True, batch_rows=10, batch_interval=10)
+    good = store.insert_snapshot(make_snapshot(1))
+    bad = store._write("INSERT INTO missing_table VALUES (?)", (1,))
+
+    with pytest.raises(Exception, match="missing_table"):
+        store.flush()
+    assert good.exception() is None
+    assert bad.exception() is not None
+    assert len(store.fetch_latest_snapshots()) == 1
+    store.close()
+
+
+def test_reads_wait_for_writes_but_leave_errors_to_futures_and_flush(tmp_path):
+    store = SQLiteStore(str(tmp_path / "k.db"), async_writes=True, batch_rows=10, batch_interval=10)
+    store.upsert_market(
+        Market(id="M1", question="Test?", close_time=datetime(2024, 1, 1), resolution_source="unit-test")
+    )
+    bad = store._write("INSERT INTO missing_table VALUES (?)", (1,))
+
+    assert [m.id for m in store.fetch_markets()] == ["M1"]
+    assert len(store.fetch_latest_snapshots()) == 0
+    assert "missing_table" in str(bad.exception(timeout=5))
+    with pytest.raises(Exception, match="missing_table"):
+        store.flush()
+    store.flush()
+    store.close()
+
+
+def test_concurrent_flushes_resolved_together_all_see_the_error(tmp_path):
+    from concurrent.futures import Future
+
+    from src.data.group_writer import FlushMarker, GroupCommitWriter
+
+    writer = GroupCommitWriter(str(tmp_path / "k.db"))
+    writer._error = RuntimeError("boom")
+    markers = [FlushMarker(Future()), FlushMarker(Future()), FlushMarker(Future(), report_errors=False)]
+    writer._resolve_markers(markers)
+    assert [str(m.future.result()) for m in markers[:2]] == ["boom", "boom"]
+    assert markers[2].future.result() is None
+    assert writer._error is None
+    writer.close()
+
+
+def test_async_writes_reject_memory_db():
+    with pytest.raises(ValueError):
+        SQLiteStore(":memory:", async_writes=True)
+
+
+def test_flush_and_writes_after_close_raise_instead_of_hanging(tmp_path):
+    store = SQLiteStore(str(tmp_path / "k.db"), async_writes=True)
+    store.insert_snapshot(make_snapshot(1))
+    store.close()
+
+    with pytest.raises(RuntimeError, match="writer is closed"):
+        store.flush(timeout=5)
+    with pytest.raises(RuntimeError, match="writer is closed"):
+        store.writer.submit("INSERT INTO snapshots DEFAULT VALUES", ())
+    store.writer.close()  # idempotent
+
+
+def test_markers_left_on_queue_are_resolved_when_thread_stops(tmp_path):
+    from concurrent.futures import Future
+
+    from src.data.group_writer import _STOP, FlushMarker, GroupCommitWriter
+
+    writer = GroupCommitWriter(str(tmp_path / "k.db"))
+    stray: Future = Future()
+    # Simulate a flush that raced past the closed check and landed behind _STOP
+    writer._queue.put(_STOP)
+    writer._queue.put(FlushMarker(stray))
+    writer._thread.join(timeout=5)
+
+    with pytest.raises(RuntimeError, match="writer is closed"):
+        stray.result(timeout=5)
+    with pytest.raises(RuntimeError, match="writer is closed"):
+        writer.flush(timeout=5)
+
+
+def test_queue_bound_counts_batch_rows(tmp_path):
+    import threading
+
+    from src.data.group_writer import GroupCommitWriter
+
+    writer = GroupCommitWriter(str(tmp_path / "k.db"), batch_rows=1000, batch_interval=60, max_queue_rows=10)
+    writer.submit("CREATE TABLE t (x INTEGER)", ())
+    writer.flush(timeout=5)
+
+    sql = "INSERT INTO t VALUES (?)"
+    writer.submit(sql, [(i,) for i in range(8)], many=True)
+    blocked = threading.Thread(target=writer.submit, args=(sql, [(i,) for i in range(5)]), kwargs={"many": True})
+    blocked.start()
+    blocked.join(timeout=0.2)
+    assert blocked.is_alive()  # 8 + 5 rows would exceed the 10-row bound
+
+    writer.flush(timeout=5)  # commits the 8 rows and frees their budget
+    blocked.join(timeout=5)
+    assert not blocked.is_alive()
+
+    # A batch larger than the bound is still accepted once the queue drains,
+    # and flushing behind it does not wait on the row budget
+    writer.flush(timeout=5)
+    future = writer.submit(sql, [(i,) for i in range(25)], many=True)
+    writer.flush(timeout=1)
+    assert future.exception() is None
+    writer.close()
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_loop_crash_fails_inflight_writes_and_wakes_blocked_producers(tmp_path):
+    import threading
+
+    from src.data.group_writer import GroupCommitWriter
+
+    writer = GroupCommitWriter(str(tmp_path / "k.db"), batch_rows=5, batch_interval=60, max_queue_rows=5)
+    gate = threading.Event()
+
+    def crash(conn, ops):
+        gate.wait(timeout=5)
+        raise MemoryError("disk thread died")
+
+    writer._commit_group = crash
+    inflight = writer.submit("INSERT INTO t VALUES (?)", [(i,) for i in range(5)], many=True)
+    errors = []
+
+    def produce():
+        try:
+            writer.submit("INSERT INTO t VALUES (?)", (1,))
+        except RuntimeError as exc:
+            errors.append(exc)
+
+    blocked = threading.Thread(target=produce)
+    blocked.start()
+    blocked.join(timeout=0.2)
+    assert blocked.is_alive()  # waiting on the full row budget
+
+    gate.set()
+    with pytest.raises(RuntimeError, match="writer thread failed"):
+        inflight.result(timeout=5)
+    blocked.join(timeout=5)
+    assert not blocked.is_alive()
+    assert errors and "writer is closed" in str(errors[0])
+    writer.close()
@@ -0,0 +1,35 @@
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Roughly 2x the measured cost of `import src.runner` (pydantic dominates);
+# eager HTTP clients alone pushed it past this.
+IMPORT_BUDGET_US = 400_000
+HEAVY_MODULES = ("requests", "aiohttp", "orjson", "numpy", "pandas", "matplotlib", "sqlalchemy")
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], cwd=ROOT, capture_output=True, text=True, check=True)
+
+
+def test_runner_import_stays_within_budget():
+    result = run_python("-X", "importtime", "-c", "import src.runner")
+    match = re.search(r"^import time:\s+\d+ \|\s+(\d+) \| src\.runner$", result.stderr, re.MULTILINE)
+    assert match, result.stderr[-500:]
+    assert int(match.group(1)) < IMPORT_BUDGET_US
+
+
+def test_runner_and_packages_do_not_import_heavy_dependencies():
+    code = (
+        "import sys, src.runner, src.api, src.data, src.execution, src.reporting; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    assert run_python("-c", code).stdout.strip() == ""
+
+
+def test_sample_pass_runs(tmp_path):
+    result = run_python("-m", "src.runner", "--sample", "--db", str(tmp_path / "k.db"))
+    assert "Snapshot saved for SAMPLE-2024" in result.stdout
@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.data.market_index import MarketIndex
+from src.data.sqlite_store import SQLiteStore
+from src.execution.paper_trader import PaperTrader
+from src.execution.settlement import settlement_sweep
+from src.models.schemas import Market, TradeDecision
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_market(market_id: str, hours: float) -> Market:
+    return Market(
+        id=market_id,
+        question=f"{market_id}?",
+        close_time=T0 + timedelta(hours=hours),
+        resolution_source="unit-test",
+    )
+
+
+def test_window_query_and_expiry():
+    index = MarketIndex([make_market("C", 3), make_market("A", 1), make_market("B", 2)])
+
+    window = index.closing_between(T0 + timedelta(hours=1), T0 + timedelta(hours=3))
+    assert [m.id for m in window] == ["A", "B"]
+
+    expired = index.expire(T0 + timedelta(hours=2))
+    assert [m.id for m in expired] == ["A", "B"]
+    assert [m.id for m in index] == ["C"]
+    assert set(index.awaiting_resolution) == {"A", "B"}
+
+
+def test_add_rekeys_moved_close_time():
+    index = MarketIndex([make_market("A", 1), make_market("B", 2)])
+    index.add(make_market("A", 5))
+    assert [m.id for m in index] == ["B", "A"]
+    assert len(index) == 2
+
+
+def test_from_store_treats_naive_close_time_as_utc(tmp_path):
+    store = SQLiteStore(str(tmp_path / "k.db"))
+    store.upsert_market(Market(id="N", question="?", close_time=datetime(2024, 1, 1, 1), resolution_source="x"))
+    index = MarketIndex.from_store(store)
+    store.close()
+
+    assert [m.id for m in index.expire(T0 + timedelta(hours=1))] == ["N"]
+
+
+def test_settlement_sweep_settles_only_resolved_positions():
+    index = MarketIndex([make_market("A", 1), make_market("B", 1), make_market("C", 5)])
+    trader = PaperTrader(starting_bankroll=100, max_risk_pct=0.05)
+    for market_id in ("A", "B"):
+        trader.execute(
+            TradeDecision(market_id=market_id, ts=T0, side="YES", price=0.2, size=5, reason="test")
+        )
+
+    settled = settlement_sweep(index, trader, {"A": 1}, now=T0 + timedelta(hours=2))
+    assert [o.market_id for o in settled] == ["A"]
+    assert settled[0].pnl == pytest.approx(4.0)
+    assert set(trader.positions) == {"B"}
+    assert set(index.awaiting_resolution) == {"B"}
+    assert [m.id for m in index] == ["C"]
+
+
+def test_bulk_load_keeps_last_duplicate_and_sorts():
+    index = MarketIndex([make_market("B", 2), make_market("A", 4), make_market("A", 1)])
+    assert [m.id for m in index] == ["A", "B"]
+    assert index.closing_between(T0, T0 + timedelta(hours=1, minutes=1))[0].close_time == T0 + timedelta(hours=1)
+
+
+def test_expire_boundary_matches_is_pollable():
+    from src.data.market_index import close_timestamp, is_pollable
+
+    market = make_market("A", 1)
+    now = T0 + timedelta(hours=1)
+    assert not is_pollable(close_timestamp(market), now)
+    assert [m.id for m in MarketIndex([market]).expire(now)] == ["A"]
+
+
+def test_settlement_sweep_feeds_report_store(tmp_path):
+    from src.reporting.report_store import ReportStore
+
+    index = MarketIndex([make_market("A", 1), make_market("B", 1)])
+    trader = PaperTrader(starting_bankroll=100, max_risk_pct=0.05)
+    for market_id, reason in (("A", "edge=0.050"), ("B", "edge=0.120")):
+        trader.execute(TradeDecision(market_id=market_id, ts=T0, side="YES", price=0.2, size=5, reason=reason))
+    assert trader.entry_decision("A").reason == "edge=0.050"
+
+    reports = ReportStore(str(tmp_path / "r.db"), starting_equity=100)
+    settlement_sweep(index, trader, {"A": 1, "B": 0, "Z": 1}, now=T0 + timedelta(hours=2), reports=reports)
+
+    summary = reports.summary()
+    assert summary.trades == 2
+    assert summary.equity == pytest.approx(100 + 4 - 1)
+    assert [(round(edge, 2), trades) for edge, trades, _, _ in reports.edge_histogram()] == [(0.05, 1), (0.12, 1)]
+    assert trader.entry_decision("A") is None
+    reports.close()
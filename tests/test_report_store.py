@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.models.schemas import Outcome, TradeDecision
+from src.reporting.report_store import ReportStore, parse_edge
+from src.reporting.weekly import render_weekly_report
+
+
+def make_decision(market_id: str, reason: str, price: float = 0.2) -> TradeDecision:
+    return TradeDecision(market_id=market_id, ts=datetime(2024, 1, 1), side="YES", price=price, size=5, reason=reason)
+
+
+def test_parse_edge_from_reason():
+    assert parse_edge(make_decision("M1", "edge=0.052 >= 0.030; p_hat=0.252; price=0.20")) == pytest.approx(0.052)
+    assert parse_edge(make_decision("M1", "p_hat=0.300", price=0.2)) == pytest.approx(0.1)
+    assert parse_edge(make_decision("M1", "manual")) is None
+
+
+def test_incremental_equity_drawdown_and_histogram(tmp_path):
+    db_path = str(tmp_path / "r.db")
+    ts = datetime(2024, 1, 1)
+    store = ReportStore(db_path, starting_equity=100)
+    store.record_settlement(Outcome(market_id="A", resolved_value=1, pnl=4), make_decision("A", "edge=0.050"), ts)
+    store.record_settlements(
+        [
+            (Outcome(market_id="B", resolved_value=0, pnl=-6), make_decision("B", "edge=0.052"), ts + timedelta(hours=1)),
+            (Outcome(market_id="C", resolved_value=1, pnl=1), None, ts + timedelta(hours=2)),
+        ]
+    )
+    store.close()
+
+    # Reopening keeps state instead of resetting to the starting equity
+    store = ReportStore(db_path, starting_equity=999)
+    summary = store.summary()
+    assert summary.equity == pytest.approx(99)
+    assert summary.peak == pytest.approx(104)
+    assert summary.max_drawdown == pytest.approx(6)
+    assert summary.trades == 3
+
+    assert [p.drawdown for p in store.equity_curve()] == pytest.approx([0, 6, 5])
+    assert [p.market_id for p in store.equity_curve(since=ts + timedelta(hours=1))] == ["B", "C"]
+    assert store.edge_histogram() == [(pytest.approx(0.05), 2, 1, pytest.approx(-2))]
+    store.close()
+
+
+def test_concurrent_writers_do_not_lose_updates(tmp_path):
+    import threading
+
+    db_path = str(tmp_path / "r.db")
+    ts = datetime(2024, 1, 1)
+    trader = ReportStore(db_path, starting_equity=0)
+    cron_ready, go = threading.Event(), threading.Event()
+
+    def cron_settle() -> None:
+        with ReportStore(db_path) as cron:
+            cron_ready.set()
+            go.wait(timeout=5)
+            cron.record_settlement(Outcome(market_id="CRON", resolved_value=1, pnl=1), None, ts)
+
+    cron = threading.Thread(target=cron_settle)
+    cron.start()
+    cron_ready.wait(timeout=5)
+
+    def trader_items():
+        yield Outcome(market_id="T1", resolved_value=1, pnl=1), None, ts
+        # A second writer settles while this batch is still open
+        go.set()
+        cron.join(timeout=0.3)
+        yield Outcome(market_id="T2", resolved_value=1, pnl=1), None, ts
+
+    trader.record_settlements(trader_items())
+    cron.join()
+
+    summary = trader.summary()
+    assert summary.trades == 3
+    assert summary.equity == pytest.approx(3)
+    assert [p.equity for p in trader.equity_curve()] == pytest.approx([1, 2, 3])
+    trader.close()
+
+
+def test_render_weekly_report(tmp_path):
+    pytest.importorskip("matplotlib")
+    import sys
+
+    pyplot_loaded = "matplotlib.pyplot" in sys.modules
+    store = ReportStore(str(tmp_path / "r.db"), starting_equity=10)
+    now = datetime(2024, 1, 8)
+    store.record_settlement(Outcome(market_id="A", resolved_value=1, pnl=1), make_decision("A", "edge=0.04"), now)
+
+    paths = render_weekly_report(store, out_dir=str(tmp_path / "reports"), now=now)
+    assert set(paths) == {"bankroll", "drawdown", "edge_hist"}
+    # Rendering must not pull in pyplot (and with it a global backend switch)
+    assert ("matplotlib.pyplot" in sys.modules) == pyplot_loaded
+    store.close()
@@ -0,0 +1,98 @@
+from src.api.cache import ResponseCache
+from src.api.kalshi_client import KalshiClient
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload, headers=None):
+        self.status_code = status_code
+        self._payload = payload
+        self.headers = headers or {}
+        self.text = str(payload)
+        self.content = self.text.encode()
+
+    def json(self):
+        return self._payload
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_client(responses, cache):
+    calls = []
+
+    def fake_request(method, url, timeout=None, **kwargs):
+        calls.append((url, kwargs.get("headers", {})))
+        return responses.pop(0)
+
+    client = KalshiClient(base_url="https://example.com", cache=cache)
+    client.session = type("S", (), {})()
+    client.session.request = fake_request
+    return client, calls
+
+
+def test_ttl_hit_and_etag_revalidation():
+    clock = FakeClock()
+    cache = ResponseCache(ttls={"/markets": 60}, clock=clock)
+    payload = {"markets": [{"id": "M1"}]}
+    client, calls = make_client(
+        [FakeResponse(200, payload, {"ETag": '"v1"'}), FakeResponse(304, {})],
+        cache,
+    )
+
+    assert client.get_markets_paginated(limit=1) == payload["markets"]
+    assert client.get_markets_paginated(limit=1) == payload["markets"]
+    assert len(calls) == 1
+
+    clock.now += 61
+    assert client.get_markets_paginated(limit=1) == payload["markets"]
+    assert calls[-1][1]["If-None-Match"] == '"v1"'
+    assert (cache.stats.misses, cache.stats.hits, cache.stats.revalidated) == (1, 1, 1)
+    assert cache.stats.hit_rate == 2 / 3
+    assert cache.stats.bytes_saved == 2 * len(str(payload))
+
+
+def test_orderbook_bypasses_cache():
+    cache = ResponseCache(ttls={"*": 60})
+    book = {"orderbook": {"yes": [], "no": []}}
+    client, calls = make_client([FakeResponse(200, book), FakeResponse(200, book)], cache)
+
+    client.get_market_orderbook("M1")
+    client.get_market_orderbook("M1")
+    assert len(calls) == 2
+    assert len(cache) == 0
+
+
+def test_persisted_cache_stays_warm(tmp_path):
+    path = str(tmp_path / "cache.json")
+    cache = ResponseCache(persist_path=path)
+    cache.store("/markets?limit=1", {"markets": []}, ttl=60, headers={"Last-Modified": "yesterday"})
+    cache.save()
+
+    reloaded = ResponseCache(persist_path=path)
+    entry, fresh = reloaded.lookup("/markets?limit=1")
+    assert fresh
+    assert entry.validators() == {"If-Modified-Since": "yesterday"}
+
+
+def test_market_pages_report_cache_reuse_and_wire_bytes():
+    clock = FakeClock()
+    cache = ResponseCache(ttls={"/markets": 60}, clock=clock)
+    payload = {"markets": [{"id": "M1"}]}
+    client, _ = make_client(
+        [FakeResponse(200, payload, {"ETag": '"v1"', "Content-Length": "12"}), FakeResponse(304, {})],
+        cache,
+    )
+
+    assert [page.unchanged for page in client.iter_market_pages(limit=1)] == [False]
+    assert [page.unchanged for page in client.iter_market_pages(limit=1)] == [True]
+    clock.now += 61
+    pages = list(client.iter_market_pages(limit=1))
+    assert [page.unchanged for page in pages] == [True]
+    assert pages[0].markets == payload["markets"]
+    # Saved bytes count the (compressed) Content-Length, not the decoded body
+    assert cache.stats.bytes_saved == 2 * 12
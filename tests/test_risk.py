@@ -0,0 +1,81 @@
+import time
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src.execution.paper_trader import Position
+from src.execution.risk import monte_carlo_risk, simulate_pnl
+from src.models.schemas import TradeDecision
+
+
+def make_position(market_id: str = "M1", side: str = "YES", price: float = 0.4, size: int = 10) -> Position:
+    return Position(market_id=market_id, side=side, entry_price=price, size=size, opened_at=datetime(2024, 1, 1))
+
+
+def test_simulate_pnl_matches_settlement_payoffs():
+    yes = make_position("M1", "YES", price=0.4, size=10)
+    no = make_position("M2", "NO", price=0.4, size=10)
+
+    pnl = simulate_pnl([yes, no], {"M1": 1.0, "M2": 0.0}, n_scenarios=10)
+    # YES wins 10 - 4 = 6; NO wins 10 - 6 = 4
+    assert np.allclose(pnl, 10.0)
+
+    pnl = simulate_pnl([yes, no], {"M1": 0.0, "M2": 1.0}, n_scenarios=10)
+    assert np.allclose(pnl, -4.0 - 6.0)
+
+
+def test_monte_carlo_risk_statistics():
+    positions = [make_position(f"M{i}", price=0.5, size=2) for i in range(20)]
+    probs = {p.market_id: 0.5 for p in positions}
+
+    report = monte_carlo_risk(positions, probs, daily_loss_cap=10, n_scenarios=200_000, seed=7)
+    assert report.expected_pnl == pytest.approx(0.0, abs=0.05)
+    assert report.cvar >= report.var > 0
+    # Losing 10 means at most 5 of 20 fair coins land YES: P ~= 0.0207
+    assert report.breach_probability == pytest.approx(0.0207, abs=0.003)
+
+
+def test_monte_carlo_risk_candidate_and_validation():
+    candidate = TradeDecision(
+        market_id="M9", ts=datetime(2024, 1, 1), side="YES", price=0.3, size=10, reason="test"
+    )
+    report = monte_carlo_risk([], {"M9": 0.0}, daily_loss_cap=2, candidate=candidate, n_scenarios=100)
+    assert report.var == pytest.approx(3.0)
+    assert report.breach_probability == 1.0
+
+    with pytest.raises(ValueError):
+        monte_carlo_risk([make_position("M1")], {})
+
+
+def test_simulate_pnl_is_fast_for_100_positions():
+    positions = [make_position(f"M{i}", price=0.3, size=5) for i in range(100)]
+    probs = {p.market_id: 0.35 for p in positions}
+    simulate_pnl(positions, probs, n_scenarios=100_000, seed=1)  # warm up
+
+    start = time.perf_counter()
+    simulate_pnl(positions, probs, n_scenarios=100_000, seed=1)
+    assert time.perf_counter() - start < 0.25
+
+
+def test_simulate_pnl_near_certain_probabilities():
+    yes = make_position("M1", "YES", price=0.5, size=10)
+
+    # Rounds up to a certain YES rather than wrapping the 32-bit threshold
+    pnl = simulate_pnl([yes], {"M1": 1 - 1e-10}, n_scenarios=1000, seed=3)
+    assert pnl.mean() == pytest.approx(5.0)
+
+    pnl = simulate_pnl([yes], {"M1": 1e-10}, n_scenarios=1000, seed=3)
+    assert pnl.mean() == pytest.approx(-5.0)
+
+    pnl = simulate_pnl([yes], {"M1": 0.9999}, n_scenarios=200_000, seed=3)
+    assert pnl.mean() == pytest.approx(10 * 0.9999 - 5, abs=0.01)
+
+
+def test_simulate_pnl_keeps_rare_tail_events():
+    yes = make_position("M1", "YES", price=0.5, size=10)
+
+    # Well below 1/65536, yet still drawn at about its true rate
+    pnl = simulate_pnl([yes], {"M1": 5e-6}, n_scenarios=4_000_000, seed=5)
+    hits = int((pnl > 0).sum())
+    assert 5 <= hits <= 40  # expected 20
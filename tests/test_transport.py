@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from src.api.kalshi_client import KalshiClient, KalshiHTTPError
+from src.api.transport import build_session
+
+
+def test_build_session_sizes_pool_and_requests_gzip():
+    session = build_session(pool_connections=4, pool_maxsize=48)
+    adapter = session.get_adapter("https://example.com")
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 48
+    assert adapter.poolmanager.connection_pool_kw["block"] is True
+    assert "gzip" in session.headers["Accept-Encoding"]
+
+    client = KalshiClient(base_url="https://example.com", pool_maxsize=8)
+    assert client.session.get_adapter("https://example.com").poolmanager.connection_pool_kw["maxsize"] == 8
+
+    with pytest.raises(ValueError):
+        build_session(pool_maxsize=0)
+
+
+def test_async_client_gathers_orderbooks_and_skips_failures():
+    pytest.importorskip("aiohttp")
+    from aiohttp import web
+
+    from src.api.async_client import AsyncKalshiClient
+
+    async def orderbook(request):
+        ticker = request.match_info["ticker"]
+        if ticker == "BAD":
+            return web.json_response({"error": "nope"}, status=404)
+        return web.json_response({"orderbook": {"yes": [[0.4, 1]], "no": []}, "ticker": ticker})
+
+    async def scenario():
+        app = web.Application()
+        app.router.add_get("/markets/{ticker}/orderbook", orderbook)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        base_url = f"http://127.0.0.1:{runner.addresses[0][1]}"
+        try:
+            async with AsyncKalshiClient(base_url=base_url, max_connections=2) as client:
+                books = await client.gather_orderbooks(["A", "BAD", "C"])
+                with pytest.raises(KalshiHTTPError):
+                    await client.get_market_orderbook("BAD")
+        finally:
+            await runner.cleanup()
+        return books
+
+    books = asyncio.run(scenario())
+    assert [ticker for ticker, _ in books] == ["A", "C"]
+    assert books[1][1]["ticker"] == "C"
+
+
+def test_async_client_caches_and_revalidates_markets():
+    pytest.importorskip("aiohttp")
+    from aiohttp import web
+
+    from src.api.async_client import AsyncKalshiClient
+    from src.api.cache import ResponseCache
+
+    seen = []
+
+    async def markets(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.json_response({"markets": [{"id": "M1"}]}, headers={"ETag": '"v1"'})
+
+    async def scenario(cache):
+        app = web.Application()
+        app.router.add_get("/markets", markets)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        base_url = f"http://127.0.0.1:{runner.addresses[0][1]}"
+        try:
+            async with AsyncKalshiClient(base_url=base_url, cache=cache) as client:
+                first = [page.unchanged async for page in client.iter_market_pages(limit=1)]
+                fresh = await client.get_markets_paginated(limit=1)
+                clock.now += 61
+                revalidated = [page.unchanged async for page in client.iter_market_pages(limit=1)]
+        finally:
+            await runner.cleanup()
+        return first, fresh, revalidated
+
+    clock = type("Clock", (), {"now": 1000.0, "__call__": lambda self: self.now})()
+    cache = ResponseCache(ttls={"/markets": 60}, clock=clock)
+    first, fresh, revalidated = asyncio.run(scenario(cache))
+    assert (first, fresh, revalidated) == ([False], [{"id": "M1"}], [True])
+    assert seen == [None, '"v1"']
+    assert (cache.stats.misses, cache.stats.hits, cache.stats.revalidated) == (1, 1, 1)